@@ -66,14 +66,54 @@ HARSH_TERMS = [
 FORBIDDEN_PHRASES = HALLUCINATION_INDICATORS + HARSH_TERMS
 # ============================================================================
 
+def _resolve_db_path(db_path: str) -> str:
+    """Resolve a database path relative to script location"""
+    if os.path.isabs(db_path):
+        return db_path
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), db_path)
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Get database connection with row factory"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def peek_writing_statistics(rss_db_path: str = 'rss_articles.db', our_articles_db_path: str = 'our_articles.db') -> Dict[str, Any]:
+    """Get writing statistics with plain COUNT queries (no AI client or prompt setup)"""
+    rss_db_path = _resolve_db_path(rss_db_path)
+    our_articles_db_path = _resolve_db_path(our_articles_db_path)
+    
+    with _connect(rss_db_path) as conn:
+        cursor = conn.cursor()
+        # Both counts in one scan; TOTAL() is a float, so convert back to an int count
+        cursor.execute('SELECT COUNT(*), TOTAL(is_read = 1) FROM articles')
+        total_count, read_count = cursor.fetchone()
+        read_count = int(read_count)
+    
+    with _connect(our_articles_db_path) as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute('SELECT COUNT(*) FROM our_articles')
+            our_articles_count = cursor.fetchone()[0]
+        except sqlite3.OperationalError:
+            # Table is created on first AIWriter run
+            our_articles_count = 0
+    
+    return {
+        'total_rss_articles': total_count,
+        'read_rss_articles': read_count,
+        'unread_rss_articles': total_count - read_count,
+        'our_articles_count': our_articles_count,
+        'processing_percentage': round((read_count / total_count * 100), 2) if total_count > 0 else 0
+    }
+
 class AIWriter:
     """AI-powered article writer using Gemini"""
     
     def __init__(self, rss_db_path: str = 'rss_articles.db', our_articles_db_path: str = 'our_articles.db'):
         # Resolve paths relative to script location
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.rss_db_path = rss_db_path if os.path.isabs(rss_db_path) else os.path.join(script_dir, rss_db_path)
-        self.our_articles_db_path = our_articles_db_path if os.path.isabs(our_articles_db_path) else os.path.join(script_dir, our_articles_db_path)
+        self.rss_db_path = _resolve_db_path(rss_db_path)
+        self.our_articles_db_path = _resolve_db_path(our_articles_db_path)
         self.article_count = ARTICLE_COUNT
         
         # Load environment variables
@@ -131,9 +171,7 @@ class AIWriter:
     
     def get_connection(self, db_path: str):
         """Get database connection with row factory"""
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return _connect(db_path)
     
     def get_next_articles_to_process(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get next unread articles to process starting from newest"""
@@ -797,26 +835,7 @@ Please rewrite the following articles:
     
     def get_writing_statistics(self) -> Dict[str, Any]:
         """Get statistics about the writing process"""
-        with self.get_connection(self.rss_db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM articles WHERE is_read = 1')
-            read_count = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM articles')
-            total_count = cursor.fetchone()[0]
-        
-        with self.get_connection(self.our_articles_db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM our_articles')
-            our_articles_count = cursor.fetchone()[0]
-        
-        return {
-            'total_rss_articles': total_count,
-            'read_rss_articles': read_count,
-            'unread_rss_articles': total_count - read_count,
-            'our_articles_count': our_articles_count,
-            'processing_percentage': round((read_count / total_count * 100), 2) if total_count > 0 else 0
-        }
+        return peek_writing_statistics(self.rss_db_path, self.our_articles_db_path)
     
     def print_statistics(self):
         """Print writing statistics"""
@@ -7,22 +7,208 @@ Stores RSS articles in database with duplicate prevention and unified image hand
 import sqlite3
 import hashlib
 import json
+import heapq
 import re
 import time
 import os
-from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any, Set, Tuple
+from datetime import datetime, timezone, timedelta
+from typing import List, Dict, Optional, Any, Set, Tuple, Iterator
 import logging
 from pathlib import Path
 from urllib.parse import urlparse, urljoin
+from io import BytesIO
 import feedparser
 import requests
 import email.utils
+import html
+
+# Optional fast path: stream well-formed feeds through lxml instead of feedparser
+try:
+    from lxml import etree
+    _HAS_LXML = True
+except Exception:
+    _HAS_LXML = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Common image patterns in HTML, compiled once and tried in priority order
+_HTML_IMAGE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'<img[^>]+src=["\']([^"\']+)["\']',  # Standard img tags
+    r'<figure[^>]*>.*?<img[^>]+src=["\']([^"\']+)["\']',  # Images in figure tags
+    r'background-image:\s*url\(["\']?([^"\']+)["\']?\)',  # CSS background images
+    r'data-src=["\']([^"\']+)["\']',  # Lazy loading images
+    r'data-lazy=["\']([^"\']+)["\']',  # Alternative lazy loading
+    r'data-original=["\']([^"\']+)["\']',  # Another lazy loading pattern
+    r'data-srcset=["\']([^"\']+)["\']',  # Responsive images
+))
+
+# Patterns used by RSSFeedReader.clean_text
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_MEDIA_NS = 'http://search.yahoo.com/mrss/'
+
+# Only elements from these namespaces are read by the lxml fast path; extension
+# elements such as media:title or itunes:summary must not shadow the core fields
+_FEED_NAMESPACES = frozenset((
+    None,
+    'http://www.w3.org/2005/Atom',
+    'http://purl.org/atom/ns#',
+    'http://purl.org/rss/1.0/',
+    'http://my.netscape.com/rdf/simple/0.9/',
+    'http://purl.org/rss/1.0/modules/content/',
+    'http://purl.org/dc/elements/1.1/',
+))
+
+# Elements whose content feedparser's sanitizer drops entirely
+_UNSAFE_ELEMENT_RE = re.compile(r'<(script|style|applet)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+
+def _element_text(elem) -> str:
+    """Return element text, serializing child markup (e.g. Atom xhtml content)"""
+    if len(elem):
+        text = (elem.text or '') + ''.join(
+            etree.tostring(child, encoding='unicode', with_tail=True) for child in elem
+        )
+    else:
+        text = elem.text or ''
+    return _UNSAFE_ELEMENT_RE.sub('', text) if '<' in text else text
+
+
+def _parse_lxml_entry(elem) -> Dict[str, Any]:
+    """Build a feedparser-like entry dict holding only the fields parse_entry reads"""
+    entry: Dict[str, Any] = {}
+    tags = []
+    enclosures = []
+    content = []
+    plain_link = alternate_link = None
+    
+    for child in elem:
+        if not isinstance(child.tag, str):
+            continue  # Comments and processing instructions
+        qname = etree.QName(child)
+        if qname.namespace not in _FEED_NAMESPACES:
+            continue
+        name = qname.localname
+        
+        if name == 'title':
+            entry['title'] = _element_text(child)
+        elif name == 'link':
+            href = child.get('href')
+            rel = child.get('rel', 'alternate')
+            if href is None:
+                if plain_link is None:
+                    plain_link = (child.text or '').strip()
+            elif rel == 'alternate':
+                if alternate_link is None:
+                    alternate_link = href
+            elif rel == 'enclosure':
+                enclosures.append({'href': href, 'type': child.get('type', ''),
+                                   'length': child.get('length', '')})
+        elif name in ('description', 'summary'):
+            entry['summary'] = entry['description'] = _element_text(child)
+        elif name in ('encoded', 'content'):
+            content.append({'value': _element_text(child), 'type': child.get('type', 'text/html')})
+        elif name in ('pubDate', 'published', 'issued'):
+            entry['published'] = (child.text or '').strip()
+        elif name in ('updated', 'modified', 'date'):
+            # feedparser keeps these as 'updated' only; dc:date is not a publish date
+            entry['updated'] = (child.text or '').strip()
+        elif name in ('author', 'creator'):
+            author_name = child.findtext('{*}name')
+            entry.setdefault('author', (author_name if author_name is not None else child.text or '').strip())
+        elif name == 'category':
+            term = child.get('term') or (child.text or '').strip()
+            if term:
+                tags.append({'term': term})
+                entry.setdefault('category', term)
+        elif name in ('guid', 'id'):
+            entry['id'] = entry['guid'] = (child.text or '').strip()
+        elif name == 'enclosure':
+            enclosures.append({'href': child.get('url', ''), 'type': child.get('type', ''),
+                               'length': child.get('length', '')})
+    
+    # Plain <link> wins over Atom rel="alternate" links
+    link = plain_link if plain_link is not None else alternate_link
+    if link is not None:
+        entry['link'] = link
+    if content:
+        entry['content'] = content
+    if tags:
+        entry['tags'] = tags
+    if enclosures:
+        entry['enclosures'] = enclosures
+    
+    # media:content / media:thumbnail may be nested inside media:group
+    # Attributes are copied as-is, like feedparser (no 'type' is synthesized)
+    media_content = [dict(m.attrib) for m in elem.iter(f'{{{_MEDIA_NS}}}content')]
+    if media_content:
+        entry['media_content'] = media_content
+    media_thumbnail = [{'url': t.get('url', '')} for t in elem.iter(f'{{{_MEDIA_NS}}}thumbnail')]
+    if media_thumbnail:
+        entry['media_thumbnail'] = media_thumbnail
+    
+    return entry
+
+
+def _fast_parse_with_lxml(raw_bytes: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Stream a well-formed RSS/Atom document with lxml.
+    Returns {'feed': {...}, 'entries': [...]} mirroring the parts of feedparser's
+    result that are used here, or None when feedparser should handle the document.
+    """
+    if not _HAS_LXML or not raw_bytes:
+        return None
+    
+    entries = []
+    try:
+        context = etree.iterparse(BytesIO(raw_bytes), events=('end',),
+                                  tag=('{*}item', '{*}entry'), resolve_entities=False)
+        for _, elem in context:
+            entries.append(_parse_lxml_entry(elem))
+            elem.clear()  # Keep memory flat on large feeds
+        root = context.root
+    except etree.XMLSyntaxError:
+        return None
+    
+    if not entries or root is None:
+        return None
+    
+    # Feed metadata lives on <channel> for RSS 2.0 / RDF and on the root for Atom
+    channel = root.find('{*}channel')
+    if channel is None:
+        channel = root
+    feed: Dict[str, Any] = {}
+    alternate_link = None
+    for child in channel:
+        if not isinstance(child.tag, str):
+            continue
+        qname = etree.QName(child)
+        if qname.namespace not in _FEED_NAMESPACES:
+            continue
+        name = qname.localname
+        if name == 'title':
+            feed.setdefault('title', _element_text(child).strip())
+        elif name == 'link':
+            # Skip rel="self" and other non-alternate Atom links (the feed's own URL)
+            href = child.get('href')
+            if href is None:
+                feed.setdefault('link', (child.text or '').strip())
+            elif alternate_link is None and child.get('rel', 'alternate') == 'alternate':
+                alternate_link = href
+        elif name in ('description', 'subtitle'):
+            feed.setdefault('description', _element_text(child).strip())
+        elif name == 'language':
+            feed['language'] = (child.text or '').strip()
+        elif name in ('copyright', 'rights'):
+            feed['rights'] = (child.text or '').strip()
+    if alternate_link is not None:
+        feed.setdefault('link', alternate_link)
+    
+    return {'feed': feed, 'entries': entries}
+
 class RSSArticle:
     """Unified data model for RSS articles"""
     
@@ -95,6 +281,10 @@ class RSSFeedReader:
             'processing_start_time': None,
             'processing_end_time': None
         }
+        
+        # Monotonic timestamps (ns) for measuring processing duration
+        self._t0: Optional[int] = None
+        self._t1: Optional[int] = None
 
     def parse_datetime(self, date_string: str) -> Optional[datetime]:
         """Parse various datetime formats from RSS feeds"""
@@ -137,98 +327,71 @@ class RSSFeedReader:
             return ""
         
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_RE.sub('', text)
         
         # Decode HTML entities
         import html
         text = html.unescape(text)
         
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         return text
 
     def extract_all_image_urls(self, entry: Dict[str, Any]) -> List[str]:
         """Extract all image URLs from various possible locations"""
         image_urls = []
+        seen = set()
         
+        for url in self._iter_image_urls(entry):
+            if url not in seen:
+                seen.add(url)
+                image_urls.append(url)
+        
+        return image_urls
+    
+    def _iter_image_urls(self, entry: Dict[str, Any]) -> Iterator[str]:
+        """Yield candidate image URLs in priority order (may contain duplicates)"""
         # Check for media:content
-        if 'media_content' in entry:
-            for media in entry['media_content']:
-                if media.get('type', '').startswith('image/'):
-                    url = media.get('url', '')
-                    if url and url not in image_urls:
-                        image_urls.append(url)
+        for media in entry.get('media_content', ()):
+            if media.get('type', '').startswith('image/'):
+                url = media.get('url', '')
+                if url:
+                    yield url
         
         # Check for enclosures
-        if 'enclosures' in entry:
-            for enclosure in entry['enclosures']:
-                if enclosure.get('type', '').startswith('image/'):
-                    url = enclosure.get('href', '')
-                    if url and url not in image_urls:
-                        image_urls.append(url)
+        for enclosure in entry.get('enclosures', ()):
+            if enclosure.get('type', '').startswith('image/'):
+                url = enclosure.get('href', '')
+                if url:
+                    yield url
         
         # Check for media:thumbnail
-        if 'media_thumbnail' in entry:
-            for thumbnail in entry['media_thumbnail']:
-                url = thumbnail.get('url', '')
-                if url and url not in image_urls:
-                    image_urls.append(url)
+        for thumbnail in entry.get('media_thumbnail', ()):
+            url = thumbnail.get('url', '')
+            if url:
+                yield url
         
         # Check for content with images
         content = entry.get('content', [{}])
         if content and isinstance(content, list):
-            content_text = content[0].get('value', '')
-            urls = self._extract_images_from_html(content_text)
-            for url in urls:
-                if url not in image_urls:
-                    image_urls.append(url)
-        
-        # Check summary for images
-        summary = entry.get('summary', '')
-        if summary:
-            urls = self._extract_images_from_html(summary)
-            for url in urls:
-                if url not in image_urls:
-                    image_urls.append(url)
-        
-        # Check description for images
-        description = entry.get('description', '')
-        if description:
-            urls = self._extract_images_from_html(description)
-            for url in urls:
-                if url not in image_urls:
-                    image_urls.append(url)
+            yield from self._iter_images_from_html(content[0].get('value', ''))
         
-        return image_urls
+        # Check summary and description for images
+        yield from self._iter_images_from_html(entry.get('summary', ''))
+        yield from self._iter_images_from_html(entry.get('description', ''))
     
-    def _extract_images_from_html(self, html_content: str) -> List[str]:
-        """Extract all image URLs from HTML content using multiple patterns"""
+    def _iter_images_from_html(self, html_content: str) -> Iterator[str]:
+        """Lazily yield cleaned image URLs from HTML content, pattern by pattern"""
         if not html_content:
-            return []
-        
-        image_urls = []
+            return
         
-        # Common image patterns in HTML
-        patterns = [
-            r'<img[^>]+src=["\']([^"\']+)["\']',  # Standard img tags
-            r'<figure[^>]*>.*?<img[^>]+src=["\']([^"\']+)["\']',  # Images in figure tags
-            r'background-image:\s*url\(["\']?([^"\']+)["\']?\)',  # CSS background images
-            r'data-src=["\']([^"\']+)["\']',  # Lazy loading images
-            r'data-lazy=["\']([^"\']+)["\']',  # Alternative lazy loading
-            r'data-original=["\']([^"\']+)["\']',  # Another lazy loading pattern
-            r'data-srcset=["\']([^"\']+)["\']',  # Responsive images
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE | re.DOTALL)
-            for match in matches:
+        for pattern in _HTML_IMAGE_PATTERNS:
+            for match in pattern.finditer(html_content):
                 # Clean up the URL (remove HTML entities, etc.)
-                clean_url = self._clean_image_url(match)
-                if clean_url and clean_url not in image_urls:
-                    image_urls.append(clean_url)
-        
-        return image_urls
+                clean_url = self._clean_image_url(match.group(1))
+                if clean_url:
+                    yield clean_url
     
     def _clean_image_url(self, url: str) -> str:
         """Clean and normalize image URL"""
@@ -255,8 +418,7 @@ class RSSFeedReader:
     
     def extract_image_url(self, entry: Dict[str, Any]) -> str:
         """Extract primary image URL (backward compatibility)"""
-        image_urls = self.extract_all_image_urls(entry)
-        return image_urls[0] if image_urls else ""
+        return next(self._iter_image_urls(entry), "")
 
     def parse_entry(self, entry: Dict[str, Any], feed_info: Dict[str, Any]) -> RSSArticle:
         """Parse a single RSS entry into unified format"""
@@ -290,9 +452,10 @@ class RSSFeedReader:
         
         # Category and tags
         article.category = entry.get('category', '')
-        tags = entry.get('tags', [])
+        tags = entry.get('tags')
         if tags:
-            article.tags = [tag.get('term', str(tag)) for tag in tags]
+            # Only stringify a tag when it has no 'term' (the default was built eagerly per tag)
+            article.tags = [tag['term'] if 'term' in tag else str(tag) for tag in tags]
         
         # Media information
         article.image_urls = self.extract_all_image_urls(entry)
@@ -325,28 +488,43 @@ class RSSFeedReader:
                 response = self.session.get(feed_url, timeout=self.timeout)
                 response.raise_for_status()
                 
-                # Parse with feedparser
-                feed = feedparser.parse(response.content)
+                # Fast path for well-formed feeds, feedparser for everything else
+                parsed = _fast_parse_with_lxml(response.content)
+                if parsed is not None:
+                    feed_meta = parsed['feed']
+                    entries = parsed['entries']
+                    status = response.status_code
+                else:
+                    feed = feedparser.parse(response.content)
+                    
+                    if feed.bozo:
+                        warning_msg = f"Feed parsing warnings for {feed_url}: {feed.bozo_exception}"
+                        logger.warning(warning_msg)
+                        feed_info['errors'].append(warning_msg)
+                    
+                    feed_meta = feed.feed
+                    entries = feed.entries
+                    status = feed.status if hasattr(feed, 'status') else 200
                 
-                if feed.bozo:
-                    warning_msg = f"Feed parsing warnings for {feed_url}: {feed.bozo_exception}"
-                    logger.warning(warning_msg)
-                    feed_info['errors'].append(warning_msg)
+                # Decode leftover entities (e.g. double-escaped '&amp;ouml;') the same way
+                # for both parsers; the title becomes the articles' source_name
+                feed_title = html.unescape(feed_meta.get('title', ''))
+                feed_description = html.unescape(feed_meta.get('description', ''))
                 
-                feed_info['status'] = feed.status if hasattr(feed, 'status') else 200
-                feed_info['article_count'] = len(feed.entries)
-                feed_info['feed_title'] = feed.feed.get('title', '')
+                feed_info['status'] = status
+                feed_info['article_count'] = len(entries)
+                feed_info['feed_title'] = feed_title
                 feed_info['success'] = True
                 
                 return {
                     'href': feed_url,
-                    'title': feed.feed.get('title', ''),
-                    'link': feed.feed.get('link', ''),
-                    'description': feed.feed.get('description', ''),
-                    'language': feed.feed.get('language', ''),
-                    'rights': feed.feed.get('rights', ''),
-                    'entries': feed.entries,
-                    'status': feed.status if hasattr(feed, 'status') else 200,
+                    'title': feed_title,
+                    'link': feed_meta.get('link', ''),
+                    'description': feed_description,
+                    'language': feed_meta.get('language', ''),
+                    'rights': feed_meta.get('rights', ''),
+                    'entries': entries,
+                    'status': status,
                     'feed_info': feed_info
                 }
                 
@@ -376,7 +554,7 @@ class RSSFeedReader:
         """Read RSS feed URLs from file"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+                urls = [url for line in f if (url := line.strip()) and not url.startswith('#')]
             logger.info(f"Loaded {len(urls)} RSS feed URLs from {file_path}")
             return urls
         except Exception as e:
@@ -389,6 +567,7 @@ class RSSFeedReader:
         all_articles = []
         
         # Initialize processing start time
+        self._t0 = time.monotonic_ns()
         self.feed_results['processing_start_time'] = datetime.now()
         
         logger.info(f"Processing {len(feed_urls)} RSS feeds...")
@@ -430,12 +609,19 @@ class RSSFeedReader:
             time.sleep(0.5)
         
         # Set processing end time and total articles
-        self.feed_results['processing_end_time'] = datetime.now()
+        self._t1 = time.monotonic_ns()
+        self.feed_results['processing_end_time'] = (
+            self.feed_results['processing_start_time'] + self._processing_duration()
+        )
         self.feed_results['total_articles'] = len(all_articles)
         
         logger.info(f"Successfully processed {len(all_articles)} articles from {len(feed_urls)} feeds")
         return all_articles
 
+    def _processing_duration(self) -> timedelta:
+        """Duration of the last process_all_feeds run, from monotonic timestamps"""
+        return timedelta(microseconds=(self._t1 - self._t0) // 1000)
+
     def save_articles_to_json(self, articles: List[RSSArticle], filename: str):
         """Save articles to JSON file"""
         try:
@@ -449,86 +635,88 @@ class RSSFeedReader:
     def create_rss_log(self, filename: str = 'rsslog.txt'):
         """Create detailed RSS processing log file"""
         try:
+            parts = []
+            # Header
+            parts.append("=" * 80 + "\n")
+            parts.append("RSS FEED PROCESSING LOG\n")
+            parts.append("=" * 80 + "\n")
+            parts.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            parts.append(f"Processing started: {self.feed_results['processing_start_time'].strftime('%Y-%m-%d %H:%M:%S')}\n")
+            parts.append(f"Processing ended: {self.feed_results['processing_end_time'].strftime('%Y-%m-%d %H:%M:%S')}\n")
+            
+            if self._t0 is not None and self._t1 is not None:
+                parts.append(f"Total processing time: {self._processing_duration()}\n")
+            
+            parts.append("\n")
+            
+            # Summary
+            parts.append("SUMMARY\n")
+            parts.append("-" * 40 + "\n")
+            parts.append(f"Total articles processed: {self.feed_results['total_articles']}\n")
+            parts.append(f"Successful feeds: {len(self.feed_results['successful_feeds'])}\n")
+            parts.append(f"Failed feeds: {len(self.feed_results['failed_feeds'])}\n")
+            parts.append(f"Total feeds attempted: {len(self.feed_results['successful_feeds']) + len(self.feed_results['failed_feeds'])}\n")
+            parts.append("\n")
+            
+            # Articles by source
+            parts.append("ARTICLES BY SOURCE\n")
+            parts.append("-" * 40 + "\n")
+            if self.feed_results['articles_by_source']:
+                sorted_sources = sorted(self.feed_results['articles_by_source'].items(), 
+                                      key=lambda x: x[1], reverse=True)
+                for source, count in sorted_sources:
+                    parts.append(f"{source}: {count} articles\n")
+            else:
+                parts.append("No articles processed\n")
+            parts.append("\n")
+            
+            # Successful feeds
+            parts.append("SUCCESSFUL FEEDS\n")
+            parts.append("-" * 40 + "\n")
+            if self.feed_results['successful_feeds']:
+                for feed in self.feed_results['successful_feeds']:
+                    parts.append(f"✓ {feed['feed_title'] or 'Unknown Title'}\n")
+                    parts.append(f"  URL: {feed['url']}\n")
+                    parts.append(f"  Articles: {feed['article_count']}\n")
+                    parts.append(f"  Attempts: {feed['attempts']}\n")
+                    parts.append(f"  Status: {feed['status']}\n")
+                    if feed['errors']:
+                        parts.append(f"  Warnings: {'; '.join(feed['errors'])}\n")
+                    parts.append("\n")
+            else:
+                parts.append("No successful feeds\n")
+            parts.append("\n")
+            
+            # Failed feeds
+            parts.append("FAILED FEEDS\n")
+            parts.append("-" * 40 + "\n")
+            if self.feed_results['failed_feeds']:
+                for feed in self.feed_results['failed_feeds']:
+                    parts.append(f"✗ {feed['url']}\n")
+                    parts.append(f"  Attempts: {feed['attempts']}\n")
+                    parts.append(f"  Status: {feed['status'] or 'N/A'}\n")
+                    parts.append(f"  Errors:\n")
+                    for error in feed['errors']:
+                        parts.append(f"    - {error}\n")
+                    parts.append("\n")
+            else:
+                parts.append("No failed feeds\n")
+            parts.append("\n")
+            
+            # Feed URLs list
+            parts.append("ALL FEED URLS PROCESSED\n")
+            parts.append("-" * 40 + "\n")
+            all_feeds = self.feed_results['successful_feeds'] + self.feed_results['failed_feeds']
+            for i, feed in enumerate(all_feeds, 1):
+                status = "✓" if feed['success'] else "✗"
+                parts.append(f"{i:2d}. {status} {feed['url']}\n")
+            
+            parts.append("\n" + "=" * 80 + "\n")
+            parts.append("END OF LOG\n")
+            parts.append("=" * 80 + "\n")
+            
             with open(filename, 'w', encoding='utf-8') as f:
-                # Header
-                f.write("=" * 80 + "\n")
-                f.write("RSS FEED PROCESSING LOG\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Processing started: {self.feed_results['processing_start_time'].strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Processing ended: {self.feed_results['processing_end_time'].strftime('%Y-%m-%d %H:%M:%S')}\n")
-                
-                if self.feed_results['processing_start_time'] and self.feed_results['processing_end_time']:
-                    duration = self.feed_results['processing_end_time'] - self.feed_results['processing_start_time']
-                    f.write(f"Total processing time: {duration}\n")
-                
-                f.write("\n")
-                
-                # Summary
-                f.write("SUMMARY\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Total articles processed: {self.feed_results['total_articles']}\n")
-                f.write(f"Successful feeds: {len(self.feed_results['successful_feeds'])}\n")
-                f.write(f"Failed feeds: {len(self.feed_results['failed_feeds'])}\n")
-                f.write(f"Total feeds attempted: {len(self.feed_results['successful_feeds']) + len(self.feed_results['failed_feeds'])}\n")
-                f.write("\n")
-                
-                # Articles by source
-                f.write("ARTICLES BY SOURCE\n")
-                f.write("-" * 40 + "\n")
-                if self.feed_results['articles_by_source']:
-                    sorted_sources = sorted(self.feed_results['articles_by_source'].items(), 
-                                          key=lambda x: x[1], reverse=True)
-                    for source, count in sorted_sources:
-                        f.write(f"{source}: {count} articles\n")
-                else:
-                    f.write("No articles processed\n")
-                f.write("\n")
-                
-                # Successful feeds
-                f.write("SUCCESSFUL FEEDS\n")
-                f.write("-" * 40 + "\n")
-                if self.feed_results['successful_feeds']:
-                    for feed in self.feed_results['successful_feeds']:
-                        f.write(f"✓ {feed['feed_title'] or 'Unknown Title'}\n")
-                        f.write(f"  URL: {feed['url']}\n")
-                        f.write(f"  Articles: {feed['article_count']}\n")
-                        f.write(f"  Attempts: {feed['attempts']}\n")
-                        f.write(f"  Status: {feed['status']}\n")
-                        if feed['errors']:
-                            f.write(f"  Warnings: {'; '.join(feed['errors'])}\n")
-                        f.write("\n")
-                else:
-                    f.write("No successful feeds\n")
-                f.write("\n")
-                
-                # Failed feeds
-                f.write("FAILED FEEDS\n")
-                f.write("-" * 40 + "\n")
-                if self.feed_results['failed_feeds']:
-                    for feed in self.feed_results['failed_feeds']:
-                        f.write(f"✗ {feed['url']}\n")
-                        f.write(f"  Attempts: {feed['attempts']}\n")
-                        f.write(f"  Status: {feed['status'] or 'N/A'}\n")
-                        f.write(f"  Errors:\n")
-                        for error in feed['errors']:
-                            f.write(f"    - {error}\n")
-                        f.write("\n")
-                else:
-                    f.write("No failed feeds\n")
-                f.write("\n")
-                
-                # Feed URLs list
-                f.write("ALL FEED URLS PROCESSED\n")
-                f.write("-" * 40 + "\n")
-                all_feeds = self.feed_results['successful_feeds'] + self.feed_results['failed_feeds']
-                for i, feed in enumerate(all_feeds, 1):
-                    status = "✓" if feed['success'] else "✗"
-                    f.write(f"{i:2d}. {status} {feed['url']}\n")
-                
-                f.write("\n" + "=" * 80 + "\n")
-                f.write("END OF LOG\n")
-                f.write("=" * 80 + "\n")
+                f.write(''.join(parts))
             
             logger.info(f"RSS processing log saved to {filename}")
             
@@ -560,9 +748,8 @@ class RSSFeedReader:
                 return dt.replace(tzinfo=timezone.utc)
             return dt
         
-        recent_articles = sorted([a for a in articles if a.published], 
-                               key=lambda x: normalize_datetime(x.published), 
-                               reverse=True)[:5]
+        recent_articles = heapq.nlargest(5, (a for a in articles if a.published),
+                                         key=lambda x: normalize_datetime(x.published))
         
         if recent_articles:
             print(f"\nMost recent articles:")
@@ -588,6 +775,9 @@ class RSSDatabase:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
+                # Write-ahead logging: cheaper commits and readers don't block the writer
+                cursor.execute('PRAGMA journal_mode=WAL')
+                
                 # Create articles table with unified image_urls column
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS articles (
@@ -739,80 +929,47 @@ class RSSDatabase:
         """Check if article already exists in database"""
         try:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Check by GUID first (most reliable)
-                if article.guid:
-                    cursor.execute('SELECT id FROM articles WHERE guid = ?', (article.guid,))
-                    if cursor.fetchone():
-                        return True
-                
-                # Check by link
-                if article.link:
-                    cursor.execute('SELECT id FROM articles WHERE link = ?', (article.link,))
-                    if cursor.fetchone():
-                        return True
-                
-                # Check by content hash
-                content_hash = self.generate_content_hash(article)
-                cursor.execute('SELECT id FROM articles WHERE content_hash = ?', (content_hash,))
-                if cursor.fetchone():
-                    return True
-                
-                return False
+                return self._article_exists(conn.cursor(), article, self.generate_content_hash(article))
                 
         except Exception as e:
             logger.error(f"Error checking if article exists: {e}")
             return False
     
+    def _article_exists(self, cursor: sqlite3.Cursor, article: RSSArticle, content_hash: str) -> bool:
+        """Check by guid, link and content hash using an open cursor"""
+        # Check by GUID first (most reliable)
+        if article.guid:
+            cursor.execute('SELECT id FROM articles WHERE guid = ?', (article.guid,))
+            if cursor.fetchone():
+                return True
+        
+        # Check by link
+        if article.link:
+            cursor.execute('SELECT id FROM articles WHERE link = ?', (article.link,))
+            if cursor.fetchone():
+                return True
+        
+        # Check by content hash
+        cursor.execute('SELECT id FROM articles WHERE content_hash = ?', (content_hash,))
+        if cursor.fetchone():
+            return True
+        
+        return False
+    
     def insert_article(self, article: RSSArticle) -> bool:
         """Insert article into database if it doesn't exist, with consolidated image URLs"""
         try:
-            if self.article_exists(article):
-                logger.debug(f"Article already exists, skipping: {article.title[:50]}...")
-                return False
-            
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
+                # Hash once for both the duplicate check and the stored row
                 content_hash = self.generate_content_hash(article)
+                if self._article_exists(cursor, article, content_hash):
+                    logger.debug(f"Article already exists, skipping: {article.title[:50]}...")
+                    return False
                 
-                # Extract ALL image URLs from all possible sources
-                consolidated_image_urls = self.extract_all_image_urls_from_article(article)
-                
-                cursor.execute('''
-                    INSERT INTO articles (
-                        title, description, content, summary, link, guid,
-                        published, author, category, tags,
-                        image_urls, source_name, source_url, feed_url,
-                        content_hash
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    article.title,
-                    article.description,
-                    article.content,
-                    article.summary,
-                    article.link,
-                    article.guid,
-                    article.published.isoformat() if article.published else None,
-                    article.author,
-                    article.category,
-                    json.dumps(article.tags) if article.tags else None,
-                    json.dumps(consolidated_image_urls) if consolidated_image_urls else None,
-                    article.source_name,
-                    article.source_url,
-                    article.feed_url,
-                    content_hash
-                ))
-                
+                self._insert_article_row(cursor, article, content_hash)
                 conn.commit()
-                
-                # Log image extraction stats
-                if consolidated_image_urls:
-                    logger.debug(f"Article inserted with {len(consolidated_image_urls)} images: {article.title[:50]}...")
-                else:
-                    logger.debug(f"Article inserted (no images): {article.title[:50]}...")
-                
                 return True
                 
         except sqlite3.IntegrityError as e:
@@ -822,8 +979,44 @@ class RSSDatabase:
             logger.error(f"Error inserting article: {e}")
             return False
     
+    def _insert_article_row(self, cursor: sqlite3.Cursor, article: RSSArticle, content_hash: str):
+        """Insert one article row using an open cursor (caller commits)"""
+        # Extract ALL image URLs from all possible sources
+        consolidated_image_urls = self.extract_all_image_urls_from_article(article)
+        
+        cursor.execute('''
+            INSERT INTO articles (
+                title, description, content, summary, link, guid,
+                published, author, category, tags,
+                image_urls, source_name, source_url, feed_url,
+                content_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            article.title,
+            article.description,
+            article.content,
+            article.summary,
+            article.link,
+            article.guid,
+            article.published.isoformat() if article.published else None,
+            article.author,
+            article.category,
+            json.dumps(article.tags) if article.tags else None,
+            json.dumps(consolidated_image_urls) if consolidated_image_urls else None,
+            article.source_name,
+            article.source_url,
+            article.feed_url,
+            content_hash
+        ))
+        
+        # Log image extraction stats
+        if consolidated_image_urls:
+            logger.debug(f"Article inserted with {len(consolidated_image_urls)} images: {article.title[:50]}...")
+        else:
+            logger.debug(f"Article inserted (no images): {article.title[:50]}...")
+    
     def insert_articles_batch(self, articles: List[RSSArticle]) -> Dict[str, int]:
-        """Insert multiple articles and return statistics"""
+        """Insert multiple articles in a single transaction and return statistics"""
         stats = {
             'total_processed': len(articles),
             'new_articles': 0,
@@ -831,15 +1024,41 @@ class RSSDatabase:
             'errors': 0
         }
         
-        for article in articles:
-            try:
-                if self.insert_article(article):
-                    stats['new_articles'] += 1
-                else:
-                    stats['duplicates'] += 1
-            except Exception as e:
-                logger.error(f"Error processing article: {e}")
-                stats['errors'] += 1
+        if not articles:
+            return stats
+        
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                # WAL (set in init_database) keeps the database consistent with NORMAL sync
+                conn.execute('PRAGMA synchronous=NORMAL')
+                cursor = conn.cursor()
+                
+                for article in articles:
+                    try:
+                        # Rows inserted earlier in this transaction are visible to the check
+                        content_hash = self.generate_content_hash(article)
+                        if self._article_exists(cursor, article, content_hash):
+                            logger.debug(f"Article already exists, skipping: {article.title[:50]}...")
+                            stats['duplicates'] += 1
+                            continue
+                        
+                        self._insert_article_row(cursor, article, content_hash)
+                        stats['new_articles'] += 1
+                    except sqlite3.IntegrityError:
+                        # Only the failing statement is rolled back; the batch continues
+                        logger.debug(f"Article already exists (integrity error): {article.title[:50]}...")
+                        stats['duplicates'] += 1
+                    except Exception as e:
+                        logger.error(f"Error processing article: {e}")
+                        stats['errors'] += 1
+                
+                # One commit for the whole batch
+                conn.commit()
+                
+        except Exception as e:
+            logger.error(f"Error inserting article batch: {e}")
+            stats['errors'] += stats['new_articles']
+            stats['new_articles'] = 0
         
         return stats
     
@@ -882,6 +1101,17 @@ class RSSDatabase:
             logger.error(f"Error getting article count: {e}")
             return 0
     
+    def get_all_links(self) -> Optional[Set[str]]:
+        """Get every stored article link and guid (None if the query fails)"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT link FROM articles UNION SELECT guid FROM articles')
+                return {row[0] for row in cursor.fetchall() if row[0]}
+        except Exception as e:
+            logger.error(f"Error loading article links: {e}")
+            return None
+    
     def get_articles_by_source(self) -> Dict[str, int]:
         """Get article count by source"""
         try:
@@ -1167,7 +1397,7 @@ class RSSToDatabase:
             logger.info(f"Processing {len(feed_urls)} RSS feeds...")
             
             for i, feed_url in enumerate(feed_urls, 1):
-                feed_start_time = datetime.now()
+                feed_start_time = time.monotonic()
                 logger.info(f"Processing feed {i}/{len(feed_urls)}: {feed_url}")
                 
                 try:
@@ -1200,7 +1430,7 @@ class RSSToDatabase:
                         total_stats['errors'] += batch_stats['errors']
                         
                         # Update feed stats
-                        feed_duration = (datetime.now() - feed_start_time).total_seconds()
+                        feed_duration = time.monotonic() - feed_start_time
                         self.db.update_feed_stats(feed_url, batch_stats['new_articles'], 
                                                 feed_duration, 'success')
                         
@@ -1219,7 +1449,6 @@ class RSSToDatabase:
                     continue
                 
                 # Small delay between requests
-                import time
                 time.sleep(0.5)
             
             # Calculate total processing time
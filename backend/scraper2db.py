@@ -11,14 +11,20 @@ import re
 import time
 import os
 import sys
+import functools
+import threading
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import List, Dict, Optional, Any, Set, Tuple
 import logging
 from pathlib import Path
 from urllib.parse import urlparse, urljoin
 import requests
-from bs4 import BeautifulSoup, FeatureNotFound
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 import html
+import soupsieve
 
 # Import existing RSS classes
 from rss2db import RSSArticle, RSSDatabase
@@ -45,9 +51,87 @@ MIN_CONTENT_LENGTH_THRESHOLD = 200  # Set to 0 to disable filtering
 # Filter articles: only add to database if they have images
 REQUIRE_IMAGES = True  # Set to False to add all articles regardless of images
 
+# Upper bound on bytes read per fetched page; larger bodies are truncated
+MAX_PAGE_BYTES = 5 * 1024 * 1024  # 5 MB
+
+# Minimum spacing (seconds) between requests to the same host; different hosts are not delayed
+MIN_HOST_REQUEST_INTERVAL = 0.25
+
 
 # =============================================================================
 
+# Partial-parse filters: subtrees outside these tags are never built.
+# Listing selectors need the anchors' ancestors (e.g. '.news-item a'), so the
+# listing filter keeps the whole <body> and only drops <head> scripts/styles.
+LISTING_PAGE_STRAINER = SoupStrainer('body')
+# Article extraction reads <meta> tags from <head> plus the body content
+ARTICLE_PAGE_STRAINER = SoupStrainer(['meta', 'body'])
+# Strainer per page type, selected by the mode argument of WebScraper.parse_page.
+# Narrower tag lists are not used: dropping non-matching ancestors would break
+# descendant selectors, and would keep nav/footer links as stray top-level tags.
+PAGE_STRAINERS = {
+    'listing': LISTING_PAGE_STRAINER,
+    'article': ARTICLE_PAGE_STRAINER,
+}
+
+# Numeric ID patterns (common in Turkish news sites), combined into one alternation
+_NUMERIC_ID_RE = re.compile('|'.join([
+    r'/\d{4,}',  # /123456 or longer
+    r'/\d+[-_]',  # /123456-title or /123456_title
+    r'/\d+\.html',  # /123456.html
+]))
+
+# Domain-specific article URL patterns, one compiled alternation per domain
+_DOMAIN_URL_RES = {domain: re.compile('|'.join(patterns)) for domain, patterns in {
+    'internethaber.com': [
+        r'/[a-z0-9-]+-\d+h\.htm',  # Most common pattern: article-name-1234567h.htm
+        r'/\d{4}/\d{2}/\d{2}/',  # Date-based URLs
+        r'/[a-z-]+-\d+',  # slug-number pattern
+        r'/haber/[a-z0-9-]+',  # /haber/slug pattern
+        r'/gundem/[a-z0-9-]+',  # /gundem/slug pattern
+        r'/son-dakika/[a-z0-9-]+',  # /son-dakika/slug pattern
+        r'/sondakika/[a-z0-9-]+',  # /sondakika/slug pattern
+        r'/guncel/[a-z0-9-]+',  # /guncel/slug pattern
+    ],
+    'haberturk.com': [
+        r'/haberler/\d+',  # /haberler/123456
+        r'/\d{4}/\d{2}/\d{2}/',
+    ]
+}.items()}
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_selector(selector: str):
+    """Compile a CSS selector once; soup.select() re-parses it on every call"""
+    return soupsieve.compile(selector)
+
+
+def fast_select(soup, selector: str) -> list:
+    """soup.select() using the cached compiled selector"""
+    return _compiled_selector(selector).select(soup)
+
+
+def fast_select_one(soup, selector: str):
+    """soup.select_one() using the cached compiled selector"""
+    return _compiled_selector(selector).select_one(soup)
+
+def url_digest(url: str) -> int:
+    """Compact 64-bit fingerprint of a URL for in-memory duplicate pre-checks"""
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+# Whitespace runs collapsed by clean_text
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Title tokenizer for matching image URLs against the article title
+_TITLE_TOKEN_SPLIT_RE = re.compile(r"[^a-zA-ZçğıöşüÇĞİÖŞÜ0-9]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _title_tokens(title: str) -> Tuple[str, ...]:
+    """Lowercased title words of 4+ characters (cached: called once per candidate image)"""
+    return tuple(t for t in _TITLE_TOKEN_SPLIT_RE.split(title.lower()) if len(t) >= 4)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -55,10 +139,20 @@ logger = logging.getLogger(__name__)
 class WebScraper:
     """Main web scraper class with URL duplicate checking"""
     
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, timeout: int = 30, max_retries: int = 3, max_connections: int = 8):
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_connections = max_connections  # Upper bound for concurrent fetches
+        self._parser = self._select_parser()
+        # Per-host politeness: next allowed request start per netloc (shared by fetch threads)
+        self._host_next_request = {}
+        self._host_lock = threading.Lock()
         self.session = requests.Session()
+        # One keep-alive pool per host, sized for fetch_many_contents so concurrent
+        # fetches reuse connections instead of opening (and discarding) extra ones
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -73,6 +167,19 @@ class WebScraper:
             'processing_end_time': None
         }
     
+    @staticmethod
+    def _select_parser() -> str:
+        """Pick the BeautifulSoup parser once: lxml if available, else built-in html.parser"""
+        if _HAS_LXML:
+            try:
+                BeautifulSoup(b'<a></a>', 'lxml')
+                return 'lxml'
+            except (FeatureNotFound, Exception) as e:
+                logger.warning(f"lxml parser not usable; falling back to html.parser: {e}")
+        else:
+            logger.warning("lxml parser not available; falling back to html.parser")
+        return 'html.parser'
+    
     def clean_text(self, text: str) -> str:
         """Clean and normalize text content"""
         if not text:
@@ -82,29 +189,30 @@ class WebScraper:
         text = html.unescape(text)
         
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         return text
     
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page"""
+    def fetch_content(self, url: str) -> Optional[bytes]:
+        """Fetch a web page and return the raw response body"""
         for attempt in range(self.max_retries):
             try:
+                self._wait_for_host(url)
                 logger.info(f"Fetching page: {url} (attempt {attempt + 1})")
                 
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                
-                # Parse with BeautifulSoup, robust fallback if lxml is unavailable
-                if _HAS_LXML:
-                    try:
-                        return BeautifulSoup(response.content, 'lxml')
-                    except (FeatureNotFound, Exception) as e:
-                        logger.warning(f"lxml parser not usable; falling back to html.parser: {e}")
-                        return BeautifulSoup(response.content, 'html.parser')
-                else:
-                    logger.warning("lxml parser not available; falling back to html.parser")
-                    return BeautifulSoup(response.content, 'html.parser')
+                # Stream the body in chunks so oversized pages never sit fully in memory
+                with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                    response.raise_for_status()
+                    
+                    chunks = []
+                    size = 0
+                    for chunk in response.iter_content(chunk_size=65536):
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= MAX_PAGE_BYTES:
+                            logger.warning(f"Page larger than {MAX_PAGE_BYTES} bytes, truncating: {url}")
+                            break
+                    return b''.join(chunks)[:MAX_PAGE_BYTES]
                 
             except requests.exceptions.RequestException as e:
                 error_msg = f"Network error fetching {url}: {e}"
@@ -113,16 +221,59 @@ class WebScraper:
                     time.sleep(2 ** attempt)  # Exponential backoff
                 else:
                     return None
-            except Exception as e:
-                error_msg = f"Error parsing page {url}: {e}"
-                logger.error(error_msg)
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-                else:
-                    return None
+            except ValueError as e:
+                # Malformed URL (e.g. a broken line in the sources file); retrying won't help
+                logger.error(f"Invalid URL {url}: {e}")
+                return None
         
         return None
     
+    def _wait_for_host(self, url: str):
+        """Sleep until MIN_HOST_REQUEST_INTERVAL has passed since the last request slot for this host"""
+        host = urlparse(url).netloc.lower()
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next_request.get(host, 0.0))
+            # Reserve the slot before sleeping so concurrent threads queue up behind it
+            self._host_next_request[host] = slot + MIN_HOST_REQUEST_INTERVAL
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def parse_content(self, content: bytes, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Parse a fetched page, optionally building only the parts matched by parse_only"""
+        try:
+            return BeautifulSoup(content, self._parser, parse_only=parse_only)
+        except Exception as e:
+            logger.error(f"Error parsing page: {e}")
+            return None
+    
+    def parse_page(self, content: bytes, mode: str) -> Optional[BeautifulSoup]:
+        """Parse a fetched page with the strainer for its page type ('listing' or 'article')"""
+        return self.parse_content(content, parse_only=PAGE_STRAINERS[mode])
+    
+    def fetch_page(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Fetch and parse a web page, optionally building only the parts matched by parse_only"""
+        content = self.fetch_content(url)
+        if content is None:
+            return None
+        return self.parse_content(content, parse_only=parse_only)
+    
+    def fetch_many_contents(self, urls: List[str]) -> Dict[str, Optional[bytes]]:
+        """Fetch several pages concurrently without parsing them, bounded by max_connections"""
+        if not urls:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_connections, len(urls))) as executor:
+            return dict(zip(urls, executor.map(self._fetch_content_or_none, urls)))
+    
+    def _fetch_content_or_none(self, url: str) -> Optional[bytes]:
+        """fetch_content for batch use: an unexpected error fails only this URL"""
+        try:
+            return self.fetch_content(url)
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None
+    
     def check_url_exists(self, url: str, db: RSSDatabase) -> bool:
         """Check if article URL already exists in database"""
         try:
@@ -133,10 +284,66 @@ class WebScraper:
         except Exception as e:
             logger.error(f"Error checking URL existence: {e}")
             return False
+    
+    def check_urls_exist(self, urls: List[str], db: RSSDatabase, chunk_size: int = 400) -> Set[str]:
+        """Return the subset of URLs already stored as an article link or guid"""
+        existing = set()
+        if not urls:
+            return existing
+        
+        try:
+            with sqlite3.connect(db.db_path) as conn:
+                cursor = conn.cursor()
+                # Chunked to stay below SQLite's bound-parameter limit (two per URL)
+                for start in range(0, len(urls), chunk_size):
+                    chunk = urls[start:start + chunk_size]
+                    placeholders = ','.join('?' * len(chunk))
+                    # UNION lets each branch use its own index (idx_link / idx_guid)
+                    cursor.execute(f'''
+                        SELECT link FROM articles WHERE link IN ({placeholders})
+                        UNION
+                        SELECT guid FROM articles WHERE guid IN ({placeholders})
+                    ''', chunk + chunk)
+                    existing.update(row[0] for row in cursor.fetchall())
+            return existing
+        except Exception as e:
+            logger.error(f"Error checking URL existence: {e}")
+            return set()
 
 class SiteProfileManager:
     """Manage site-specific extraction profiles and configurations"""
     
+    # Profile used for domains without a site-specific entry (shared, do not mutate)
+    _DEFAULT_PROFILE = {
+        'article_selectors': [
+            'a[href*="/haber/"]',
+            'a[href*="/gundem/"]',
+            'a[href*="/son-dakika/"]',
+            'a[href*="/article/"]',
+            'a[href*="/news/"]',
+            'article a',
+            '.news-item a',
+            '.article-item a',
+            '[class*="article"] a',
+            '[class*="news"] a',
+            '[class*="haber"] a',
+            '.item a',
+            '.post a',
+            '.entry a'
+        ],
+        'url_validation': 'strict',
+        'max_articles': 5,
+        'content_selectors': [
+            '.article-content',
+            '.news-content',
+            '.post-content',
+            '.entry-content',
+            '[class*="content"]',
+            '[class*="article"]',
+            '[class*="news"]'
+        ]
+    }
+    
     def __init__(self):
         self.profiles = {
             'internethaber.com': {
@@ -232,47 +439,120 @@ class SiteProfileManager:
                 ]
             }
         }
+        
+        # Precompute merged selectors so listing pages are traversed once per domain
+        self._compiled = {domain: self._compile_profile(profile) for domain, profile in self.profiles.items()}
+        self._default_compiled = self._compile_profile(self._DEFAULT_PROFILE)
+    
+    @staticmethod
+    def _compile_profile(profile: Dict[str, Any]) -> Dict[str, str]:
+        """Derive the per-domain lookup data used on the hot listing path"""
+        return {
+            'selector': ', '.join(profile['article_selectors']),
+            'validation': profile.get('url_validation', 'strict')
+        }
+    
+    def get_merged_selector(self, domain: str) -> str:
+        """Get all article selectors for domain merged into one CSS selector list"""
+        return self._compiled.get(domain, self._default_compiled)['selector']
     
     def get_profile(self, domain: str) -> Dict[str, Any]:
         """Get site-specific profile or return default"""
-        return self.profiles.get(domain, {
-            'article_selectors': [
-                'a[href*="/haber/"]',
-                'a[href*="/gundem/"]',
-                'a[href*="/son-dakika/"]',
-                'a[href*="/article/"]',
-                'a[href*="/news/"]',
-                'article a',
-                '.news-item a',
-                '.article-item a',
-                '[class*="article"] a',
-                '[class*="news"] a',
-                '[class*="haber"] a',
-                '.item a',
-                '.post a',
-                '.entry a'
-            ],
-            'url_validation': 'strict',
-            'max_articles': 5,
-            'content_selectors': [
-                '.article-content',
-                '.news-content',
-                '.post-content',
-                '.entry-content',
-                '[class*="content"]',
-                '[class*="article"]',
-                '[class*="news"]'
-            ]
-        })
+        return self.profiles.get(domain, self._DEFAULT_PROFILE)
     
     def get_validation_mode(self, domain: str) -> str:
         """Get URL validation mode for domain"""
-        profile = self.get_profile(domain)
-        return profile.get('url_validation', 'strict')
+        return self._compiled.get(domain, self._default_compiled)['validation']
 
 class ArticleListingParser:
     """Extract article URLs from listing pages"""
     
+    # Common non-article patterns
+    _SKIP_PATTERNS = (
+        '/category/',
+        '/tag/',
+        '/author/',
+        '/page/',
+        '/search',
+        '/contact',
+        '/about',
+        '/privacy',
+        '/terms',
+        '/rss',
+        '/feed',
+        '/sitemap',
+        '/login',
+        '/register',
+        '/social',
+        '/share',
+        '/comment',
+        '/reply',
+        '/edit',
+        '/admin',
+        '/wp-',
+        '/api/',
+        '/ajax/',
+        '.pdf',
+        '.jpg',
+        '.png',
+        '.gif',
+        '.css',
+        '.js',
+        # Additional category/listing patterns
+        '/haberler',  # Category listing pages
+        '/kategori/',  # Turkish for category
+        '/arsiv/',  # Archive pages
+        '/liste/',  # List pages
+        # Specific category pages to skip
+        '/son-dakika',  # Category pages
+        '/son-dakika-',  # Category pages with suffixes
+        '/sondakika-haberleri',  # Category pages
+        '/guncel-haberler',  # Category pages
+        '/guncel-haberler-',  # Category pages with suffixes
+        '/spor',  # Sports category
+        '/ekonomi',  # Economy category
+        '/saglik',  # Health category
+        '/teknoloji',  # Technology category
+        '/kultur-sanat',  # Culture category
+        '/dunya',  # World news category
+        '/politika'  # Politics category
+    )
+    
+    # Keywords required by strict validation
+    _STRICT_KEYWORDS = (
+        'haber',
+        'gundem',
+        'son-dakika',
+        'article',
+        'news',
+        'post',
+        'entry'
+    )
+    
+    # Article-like keywords accepted by permissive validation (less strict)
+    _PERMISSIVE_KEYWORDS = _STRICT_KEYWORDS + (
+        'detay', 'icerik', 'makale', 'yazi'  # Additional Turkish keywords
+    )
+    
+    # Asset paths that are never articles, even with a long path
+    _ASSET_PATHS = ('/wp-content/', '/static/', '/assets/')
+    
+    # Each pattern list as one alternation: a single scan of the href per category
+    _SKIP_RE = re.compile('|'.join(map(re.escape, _SKIP_PATTERNS)))
+    _STRICT_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _STRICT_KEYWORDS)))
+    _PERMISSIVE_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _PERMISSIVE_KEYWORDS)))
+    _ASSET_PATHS_RE = re.compile('|'.join(map(re.escape, _ASSET_PATHS)))
+    
+    # Domains that always use permissive URL validation
+    _PERMISSIVE_DOMAINS = frozenset({
+        'internethaber.com',
+        'haberturk.com',
+        'hurriyet.com.tr',
+        'milliyet.com.tr',
+        'sabah.com.tr',
+        'sozcu.com.tr'
+    })
+    
     def __init__(self, scraper: WebScraper):
         self.scraper = scraper
         self.profile_manager = SiteProfileManager()
@@ -280,6 +560,7 @@ class ArticleListingParser:
     def extract_article_urls(self, soup: BeautifulSoup, base_url: str, max_articles: int = 5) -> List[str]:
         """Extract article URLs from a listing page using site-specific profiles"""
         article_urls = []
+        seen = set()  # Membership checks; the list keeps insertion order
         domain = urlparse(base_url).netloc.lower()
         
         # Get site-specific profile
@@ -288,34 +569,33 @@ class ArticleListingParser:
         site_max_articles = profile.get('max_articles', max_articles)
         actual_max = min(max_articles, site_max_articles)
         
+        # Use site-specific validation mode
+        validation_mode = self.profile_manager.get_validation_mode(domain)
+        
         logger.info(f"Using {len(selectors)} selectors for domain: {domain}")
         
-        for i, selector in enumerate(selectors):
-            try:
-                links = soup.select(selector)
-                logger.debug(f"Selector {i+1}/{len(selectors)} '{selector}': found {len(links)} links")
-                
-                for link in links:
-                    href = link.get('href')
-                    if href:
-                        # Use site-specific validation mode
-                        validation_mode = self.profile_manager.get_validation_mode(domain)
-                        if self._is_valid_article_url(href, base_url, validation_mode):
-                            full_url = urljoin(base_url, href)
-                            if full_url not in article_urls:
-                                article_urls.append(full_url)
-                                logger.debug(f"Added article URL: {full_url}")
-                                
-                            if len(article_urls) >= actual_max:
-                                break
-                
+        try:
+            # All profile selectors merged into one list: a single tree walk, document order
+            links = fast_select(soup, self.profile_manager.get_merged_selector(domain))
+            logger.debug(f"Merged selectors for {domain}: found {len(links)} links")
+            
+            for link in links:
                 if len(article_urls) >= actual_max:
-                    logger.info(f"Found {len(article_urls)} articles, stopping at selector {i+1}")
+                    logger.info(f"Found {len(article_urls)} articles, stopping")
                     break
-                    
-            except Exception as e:
-                logger.warning(f"Error with selector '{selector}': {e}")
-                continue
+                
+                href = link.get('href')
+                if not href or not self._is_valid_article_url(href, domain, validation_mode):
+                    continue
+                
+                full_url = urljoin(base_url, href)
+                if full_url not in seen:
+                    seen.add(full_url)
+                    article_urls.append(full_url)
+                    logger.debug(f"Added article URL: {full_url}")
+                
+        except Exception as e:
+            logger.warning(f"Error with selectors for {domain}: {e}")
         
         # If no articles found with site-specific selectors, try generic fallbacks
         if len(article_urls) == 0:
@@ -328,46 +608,40 @@ class ArticleListingParser:
     def _extract_with_generic_fallbacks(self, soup: BeautifulSoup, base_url: str, max_articles: int) -> List[str]:
         """Extract article URLs using generic fallback selectors"""
         article_urls = []
+        seen = set()  # Membership checks; the list keeps insertion order
         domain = urlparse(base_url).netloc.lower()
         
-        # Generic fallback selectors (more permissive)
-        fallback_selectors = [
-            'a[href]',  # All links
-            'a',  # All anchor tags
-            '[href]',  # All elements with href
-        ]
-        
-        logger.info(f"Trying {len(fallback_selectors)} generic fallback selectors for {domain}")
+        # Generic fallback (more permissive): every element with an href, found in one walk.
+        # Anchors are tried first, then other href-bearing elements, as the former
+        # 'a[href]' / 'a' / '[href]' selector sequence did.
+        logger.info(f"Trying generic fallback selector for {domain}")
         
-        for i, selector in enumerate(fallback_selectors):
-            try:
-                links = soup.select(selector)
-                logger.debug(f"Fallback selector {i+1}/{len(fallback_selectors)} '{selector}': found {len(links)} links")
-                
-                for link in links:
-                    href = link.get('href')
-                    if href:
-                        # Use permissive validation for fallbacks
-                        if self._is_valid_article_url(href, base_url, 'permissive'):
-                            full_url = urljoin(base_url, href)
-                            if full_url not in article_urls:
-                                article_urls.append(full_url)
-                                logger.debug(f"Added article URL via fallback: {full_url}")
-                                
-                            if len(article_urls) >= max_articles:
-                                break
+        try:
+            elements = fast_select(soup, '[href]')
+            links = [el for el in elements if el.name == 'a'] + [el for el in elements if el.name != 'a']
+            logger.debug(f"Fallback selector '[href]': found {len(links)} links")
+            
+            for link in links:
+                href = link.get('href')
+                if href:
+                    # Use permissive validation for fallbacks
+                    if self._is_valid_article_url(href, domain, 'permissive'):
+                        full_url = urljoin(base_url, href)
+                        if full_url not in seen:
+                            seen.add(full_url)
+                            article_urls.append(full_url)
+                            logger.debug(f"Added article URL via fallback: {full_url}")
+                            
+                        if len(article_urls) >= max_articles:
+                            logger.info(f"Found {len(article_urls)} articles via fallback selectors")
+                            break
                 
-                if len(article_urls) >= max_articles:
-                    logger.info(f"Found {len(article_urls)} articles via fallback selectors")
-                    break
-                    
-            except Exception as e:
-                logger.warning(f"Error with fallback selector '{selector}': {e}")
-                continue
+        except Exception as e:
+            logger.warning(f"Error with fallback selector '[href]': {e}")
         
         return article_urls
     
-    def _is_valid_article_url(self, href: str, base_url: str, validation_mode: str = 'strict') -> bool:
+    def _is_valid_article_url(self, href: str, domain: str, validation_mode: str = 'strict') -> bool:
         """Check if URL looks like a valid article URL with flexible validation modes"""
         if not href:
             return False
@@ -377,65 +651,11 @@ class ArticleListingParser:
             return False
         
         # Skip common non-article patterns
-        skip_patterns = [
-            '/category/',
-            '/tag/',
-            '/author/',
-            '/page/',
-            '/search',
-            '/contact',
-            '/about',
-            '/privacy',
-            '/terms',
-            '/rss',
-            '/feed',
-            '/sitemap',
-            '/login',
-            '/register',
-            '/social',
-            '/share',
-            '/comment',
-            '/reply',
-            '/edit',
-            '/admin',
-            '/wp-',
-            '/api/',
-            '/ajax/',
-            '.pdf',
-            '.jpg',
-            '.png',
-            '.gif',
-            '.css',
-            '.js',
-            # Additional category/listing patterns
-            '/haberler',  # Category listing pages
-            '/kategori/',  # Turkish for category
-            '/arsiv/',  # Archive pages
-            '/liste/',  # List pages
-            # Specific category pages to skip
-            '/son-dakika',  # Category pages
-            '/son-dakika-',  # Category pages with suffixes
-            '/sondakika-haberleri',  # Category pages
-            '/guncel-haberler',  # Category pages
-            '/guncel-haberler-',  # Category pages with suffixes
-            '/spor',  # Sports category
-            '/ekonomi',  # Economy category
-            '/saglik',  # Health category
-            '/teknoloji',  # Technology category
-            '/kultur-sanat',  # Culture category
-            '/dunya',  # World news category
-            '/politika'  # Politics category
-        ]
-        
         href_lower = href.lower()
-        for pattern in skip_patterns:
-            if pattern in href_lower:
-                return False
-        
-        # Extract domain for site-specific validation
-        domain = urlparse(base_url).netloc.lower()
+        if self._SKIP_RE.search(href_lower):
+            return False
         
-        # Site-specific validation modes
+        # Site-specific validation modes (domain is the lowercased listing page host)
         if validation_mode == 'permissive' or self._should_use_permissive_mode(domain):
             return self._permissive_url_validation(href, domain)
         else:
@@ -443,87 +663,38 @@ class ArticleListingParser:
     
     def _should_use_permissive_mode(self, domain: str) -> bool:
         """Determine if domain should use permissive URL validation"""
-        permissive_domains = [
-            'internethaber.com',
-            'haberturk.com',
-            'hurriyet.com.tr',
-            'milliyet.com.tr',
-            'sabah.com.tr',
-            'sozcu.com.tr'
-        ]
-        return domain in permissive_domains
+        return domain in self._PERMISSIVE_DOMAINS
     
     def _strict_url_validation(self, href: str) -> bool:
         """Original strict validation requiring article keywords"""
-        article_keywords = [
-            'haber',
-            'gundem',
-            'son-dakika',
-            'article',
-            'news',
-            'post',
-            'entry'
-        ]
-        
         href_lower = href.lower()
-        return any(keyword in href_lower for keyword in article_keywords)
+        return self._STRICT_KEYWORDS_RE.search(href_lower) is not None
     
     def _permissive_url_validation(self, href: str, domain: str) -> bool:
         """Permissive validation for sites with different URL patterns"""
         href_lower = href.lower()
         
         # Check for numeric ID patterns (common in Turkish news sites)
-        import re
-        numeric_id_patterns = [
-            r'/\d{4,}',  # /123456 or longer
-            r'/\d+[-_]',  # /123456-title or /123456_title
-            r'/\d+\.html',  # /123456.html
-        ]
-        
-        for pattern in numeric_id_patterns:
-            if re.search(pattern, href_lower):
-                logger.debug(f"URL accepted by numeric ID pattern: {href}")
-                return True
+        if _NUMERIC_ID_RE.search(href_lower):
+            logger.debug(f"URL accepted by numeric ID pattern: {href}")
+            return True
         
         # Check for minimum path length (likely article if path is substantial)
         path = urlparse(href).path
         if len(path) > 20:  # Substantial path length
             # Additional checks to avoid false positives
-            if not any(skip in href_lower for skip in ['/wp-content/', '/static/', '/assets/']):
+            if not self._ASSET_PATHS_RE.search(href_lower):
                 logger.debug(f"URL accepted by path length: {href}")
                 return True
         
         # Domain-specific patterns
-        domain_patterns = {
-            'internethaber.com': [
-                r'/[a-z0-9-]+-\d+h\.htm',  # Most common pattern: article-name-1234567h.htm
-                r'/\d{4}/\d{2}/\d{2}/',  # Date-based URLs
-                r'/[a-z-]+-\d+',  # slug-number pattern
-                r'/haber/[a-z0-9-]+',  # /haber/slug pattern
-                r'/gundem/[a-z0-9-]+',  # /gundem/slug pattern
-                r'/son-dakika/[a-z0-9-]+',  # /son-dakika/slug pattern
-                r'/sondakika/[a-z0-9-]+',  # /sondakika/slug pattern
-                r'/guncel/[a-z0-9-]+',  # /guncel/slug pattern
-            ],
-            'haberturk.com': [
-                r'/haberler/\d+',  # /haberler/123456
-                r'/\d{4}/\d{2}/\d{2}/',
-            ]
-        }
-        
-        if domain in domain_patterns:
-            for pattern in domain_patterns[domain]:
-                if re.search(pattern, href_lower):
-                    logger.debug(f"URL accepted by domain pattern ({domain}): {href}")
-                    return True
+        domain_re = _DOMAIN_URL_RES.get(domain)
+        if domain_re and domain_re.search(href_lower):
+            logger.debug(f"URL accepted by domain pattern ({domain}): {href}")
+            return True
         
         # Fallback: check for article-like keywords (less strict)
-        article_keywords = [
-            'haber', 'gundem', 'son-dakika', 'article', 'news', 'post', 'entry',
-            'detay', 'icerik', 'makale', 'yazi'  # Additional Turkish keywords
-        ]
-        
-        if any(keyword in href_lower for keyword in article_keywords):
+        if self._PERMISSIVE_KEYWORDS_RE.search(href_lower):
             logger.debug(f"URL accepted by keyword match: {href}")
             return True
         
@@ -533,6 +704,46 @@ class ArticleListingParser:
 class ArticleContentParser:
     """Extract title, content, and image from full articles"""
     
+    # Common non-image and placeholder patterns in image URLs
+    _IMAGE_SKIP_PATTERNS = (
+        'logo', 'icon', 'avatar', 'profile', 'banner', 'advertisement', 'ad-', 'ads/', 'sponsor',
+        'social', 'share', 'button', 'arrow', 'bullet', 'dot', 'pixel', 'tracking', 'beacon',
+        'placeholder', 'place-holder', 'noimage', 'no-image', 'default', 'dummy', 'blank', 'fallback',
+        '/assets/web/images/default', '/defaults/', '/static/img/default', '/img/default'
+    )
+    
+    # URL markers of default/placeholder images
+    _DEFAULT_IMAGE_MARKERS = (
+        'default.png', 'default.jpg', 'placeholder', 'noimage', 'no-image', '/assets/web/images/default',
+        '/img/default', '/images/default', '/static/default', 'generic', 'blank'
+    )
+    
+    # Phrases that indicate site boilerplate rather than article text
+    _BOILERPLATE_INDICATORS = (
+        'cookie policy',
+        'privacy policy',
+        'terms of service',
+        'all rights reserved',
+        'copyright',
+        'follow us on',
+        'subscribe to',
+        'newsletter',
+        'advertisement',
+        'sponsored content'
+    )
+    _BOILERPLATE_RE = re.compile('|'.join(map(re.escape, _BOILERPLATE_INDICATORS)), re.IGNORECASE)
+    
+    # Author/category class lookups in priority order: exact class names, then a
+    # class substring (the former '.author', '.byline', '.writer', '[class*="author"]')
+    _CLASS_RULES = {
+        'author': (('author', 'byline', 'writer'), 'author'),
+        'category': (('category', 'section', 'tag'), 'category'),
+    }
+    
+    # Each pattern list as one alternation: a single scan of the URL
+    _IMAGE_SKIP_RE = re.compile('|'.join(map(re.escape, _IMAGE_SKIP_PATTERNS)))
+    _DEFAULT_IMAGE_RE = re.compile('|'.join(map(re.escape, _DEFAULT_IMAGE_MARKERS)))
+    
     def __init__(self, scraper: WebScraper):
         self.scraper = scraper
         self.profile_manager = SiteProfileManager()
@@ -549,8 +760,11 @@ class ArticleContentParser:
             'quality_validation': {}
         }
         
+        # Index <meta> tags once; title, image, date, author and category lookups read from it
+        meta = self._collect_meta_tags(soup)
+        
         # Extract title
-        result['title'] = self._extract_title(soup)
+        result['title'] = self._extract_title(soup, meta)
         logger.debug(f"Extracted title: {result['title'][:50]}...")
         
         # Extract content
@@ -567,25 +781,53 @@ class ArticleContentParser:
             logger.debug(f"Content quality score: {quality_validation['quality_score']:.2f}")
         
         # Extract image
-        result['image_url'] = self._extract_image(soup, article_url, result['title'])
+        result['image_url'] = self._extract_image(soup, article_url, result['title'], meta)
         logger.debug(f"Extracted image: {result['image_url'][:50]}...")
         
         # Extract metadata
-        result['published'] = self._extract_published_date(soup)
-        result['author'] = self._extract_author(soup)
-        result['category'] = self._extract_category(soup)
+        result['published'] = self._extract_published_date(soup, meta)
+        # The class index walks the whole tree, so build it only when a meta lookup misses
+        # (after content extraction, which removes boilerplate tags from the tree)
+        class_index = None
+        for prop in ('article:author', 'article:section'):
+            tag = self._meta_tag(meta, 'property', prop)
+            if not (tag and tag.get('content')):
+                class_index = self._build_class_index(soup)
+                break
+        result['author'] = self._extract_author(soup, class_index, meta)
+        result['category'] = self._extract_category(soup, class_index, meta)
         
         return result
     
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _collect_meta_tags(self, soup: BeautifulSoup) -> Dict[Tuple[str, str], List[Any]]:
+        """Map ('property'|'name', value) to its <meta> tags in document order, in a single pass"""
+        meta = {}
+        for tag in soup.find_all('meta'):
+            for attr in ('property', 'name'):
+                value = tag.get(attr)
+                if value:
+                    meta.setdefault((attr, value), []).append(tag)
+        return meta
+    
+    def _meta_tag(self, meta: Dict[Tuple[str, str], List[Any]], attr: str, value: str) -> Optional[Any]:
+        """First matching <meta> tag still in the tree (content extraction may remove some)"""
+        for tag in meta.get((attr, value), ()):
+            if not tag.decomposed:
+                return tag
+        return None
+    
+    def _extract_title(self, soup: BeautifulSoup, meta: Optional[Dict[Tuple[str, str], List[Any]]] = None) -> str:
         """Extract article title with multiple fallback strategies"""
+        if meta is None:
+            meta = self._collect_meta_tags(soup)
+        
         # Strategy 1: Open Graph title
-        og_title = soup.find('meta', attrs={'property': 'og:title'})
+        og_title = self._meta_tag(meta, 'property', 'og:title')
         if og_title and og_title.get('content'):
             return self.scraper.clean_text(og_title['content'])
         
         # Strategy 2: Twitter Card title
-        twitter_title = soup.find('meta', attrs={'name': 'twitter:title'})
+        twitter_title = self._meta_tag(meta, 'name', 'twitter:title')
         if twitter_title and twitter_title.get('content'):
             return self.scraper.clean_text(twitter_title['content'])
         
@@ -606,7 +848,7 @@ class ArticleContentParser:
         ]
         
         for selector in title_selectors:
-            title_elem = soup.select_one(selector)
+            title_elem = fast_select_one(soup, selector)
             if title_elem:
                 title = self.scraper.clean_text(title_elem.get_text())
                 if title and len(title) > 10:
@@ -643,48 +885,61 @@ class ArticleContentParser:
         ]
         
         for selector in content_selectors:
-            content_elem = soup.select_one(selector)
+            content_elem = fast_select_one(soup, selector)
             if content_elem:
                 content = self._extract_text_from_element(content_elem)
                 if content and len(content) > 100:
                     return content
         
         # Strategy 3: Largest div with paragraphs
-        divs_with_paragraphs = soup.find_all('div')
-        content_divs = []
-        
-        for div in divs_with_paragraphs:
-            paragraphs = div.find_all('p')
-            if len(paragraphs) >= 3:  # At least 3 paragraphs
-                content = self._extract_text_from_element(div)
-                if content and len(content) > 100:
-                    content_divs.append((content, len(content)))
-        
-        if content_divs:
-            # Return content from div with most text
-            content_divs.sort(key=lambda x: x[1], reverse=True)
-            return content_divs[0][0]
+        # One pass over the paragraphs: each <p> counts towards every enclosing div
+        paragraph_counts = Counter()
+        divs_by_id = {}
+        for paragraph in soup.find_all('p'):
+            for ancestor in paragraph.parents:
+                if ancestor.name == 'div':
+                    paragraph_counts[id(ancestor)] += 1
+                    divs_by_id[id(ancestor)] = ancestor
+        
+        content_div_ids = {div_id for div_id, count in paragraph_counts.items() if count >= 3}  # At least 3 paragraphs
+        best_content = ""
+        
+        for div_id in paragraph_counts:
+            if div_id not in content_div_ids:
+                continue
+            div = divs_by_id[div_id]
+            # A nested div's text is contained in its qualifying ancestor's, so only outermost divs can win
+            if any(id(ancestor) in content_div_ids for ancestor in div.parents if ancestor.name == 'div'):
+                continue
+            content = self._extract_text_from_element(div)
+            # Keep the div with most text (first one wins ties)
+            if content and len(content) > 100 and len(content) > len(best_content):
+                best_content = content
         
-        return ""
+        return best_content
     
     def _extract_text_from_element(self, element) -> str:
         """Extract clean text from an HTML element"""
         if not element:
             return ""
         
-        # Remove script and style elements
-        for tag_name in ["script", "style", "nav", "footer", "header", "aside"]:
-            for tag in element.find_all(tag_name):
+        # Remove script and style elements (one subtree walk for all tag names)
+        for tag in fast_select(element, 'script, style, nav, footer, header, aside'):
+            # Tags nested inside an already removed one are gone with it
+            if not tag.decomposed:
                 tag.decompose()
         
         # Get text and clean it
         text = element.get_text()
         return self.scraper.clean_text(text)
     
-    def _extract_image(self, soup: BeautifulSoup, article_url: str, title: str = "") -> str:
+    def _extract_image(self, soup: BeautifulSoup, article_url: str, title: str = "", meta: Optional[Dict[Tuple[str, str], List[Any]]] = None) -> str:
         """Extract article image while avoiding default/placeholder images and preferring title-related ones"""
+        if meta is None:
+            meta = self._collect_meta_tags(soup)
+        
         # Strategy 1: Open Graph image
-        og_image = soup.find('meta', attrs={'property': 'og:image'})
+        og_image = self._meta_tag(meta, 'property', 'og:image')
         if og_image and og_image.get('content'):
             img_url = urljoin(article_url, og_image['content'])
             if self._is_valid_image_url(img_url) and not self._looks_like_default_image(img_url):
@@ -692,7 +947,7 @@ class ArticleContentParser:
                     return img_url
         
         # Strategy 2: Twitter Card image
-        twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
+        twitter_image = self._meta_tag(meta, 'name', 'twitter:image')
         if twitter_image and twitter_image.get('content'):
             img_url = urljoin(article_url, twitter_image['content'])
             if self._is_valid_image_url(img_url) and not self._looks_like_default_image(img_url):
@@ -722,7 +977,7 @@ class ArticleContentParser:
                             return urljoin(article_url, src)
         
         # Strategy 4: Schema.org image
-        schema_image = soup.find('meta', attrs={'property': 'image'})
+        schema_image = self._meta_tag(meta, 'property', 'image')
         if schema_image and schema_image.get('content'):
             img_url = urljoin(article_url, schema_image['content'])
             if self._is_valid_image_url(img_url) and not self._looks_like_default_image(img_url):
@@ -741,29 +996,15 @@ class ArticleContentParser:
             return False
         
         # Skip common non-image and placeholder patterns
-        skip_patterns = [
-            'logo', 'icon', 'avatar', 'profile', 'banner', 'advertisement', 'ad-', 'ads/', 'sponsor',
-            'social', 'share', 'button', 'arrow', 'bullet', 'dot', 'pixel', 'tracking', 'beacon',
-            'placeholder', 'place-holder', 'noimage', 'no-image', 'default', 'dummy', 'blank', 'fallback',
-            '/assets/web/images/default', '/defaults/', '/static/img/default', '/img/default'
-        ]
-        
-        url_lower = url.lower()
-        for pattern in skip_patterns:
-            if pattern in url_lower:
-                return False
+        if self._IMAGE_SKIP_RE.search(url.lower()):
+            return False
         
         # Must be HTTP/HTTPS
         return url.startswith('http://') or url.startswith('https://')
 
     def _looks_like_default_image(self, url: str) -> bool:
         """Heuristic check for default/placeholder images by URL patterns"""
-        u = url.lower()
-        default_markers = [
-            'default.png', 'default.jpg', 'placeholder', 'noimage', 'no-image', '/assets/web/images/default',
-            '/img/default', '/images/default', '/static/default', 'generic', 'blank'
-        ]
-        return any(marker in u for marker in default_markers)
+        return self._DEFAULT_IMAGE_RE.search(url.lower()) is not None
 
     def _is_related_to_title(self, url: str, title: str) -> bool:
         """Prefer images whose URL contains words from the title (>=4 chars). Not strict, used for ranking."""
@@ -772,17 +1013,20 @@ class ArticleContentParser:
                 return True
             u = url.lower()
             # Extract candidate tokens from title
-            tokens = [t for t in re.split(r"[^a-zA-ZçğıöşüÇĞİÖŞÜ0-9]+", title.lower()) if len(t) >= 4]
+            tokens = _title_tokens(title)
             if not tokens:
                 return True
             return any(t in u for t in tokens)
         except Exception:
             return True
     
-    def _extract_published_date(self, soup: BeautifulSoup) -> Optional[datetime]:
+    def _extract_published_date(self, soup: BeautifulSoup, meta: Optional[Dict[Tuple[str, str], List[Any]]] = None) -> Optional[datetime]:
         """Extract article publication date"""
+        if meta is None:
+            meta = self._collect_meta_tags(soup)
+        
         # Strategy 1: Open Graph published time
-        og_published = soup.find('meta', attrs={'property': 'article:published_time'})
+        og_published = self._meta_tag(meta, 'property', 'article:published_time')
         if og_published and og_published.get('content'):
             try:
                 return datetime.fromisoformat(og_published['content'].replace('Z', '+00:00'))
@@ -790,7 +1034,7 @@ class ArticleContentParser:
                 pass
         
         # Strategy 2: Schema.org datePublished
-        schema_date = soup.find('meta', attrs={'property': 'datePublished'})
+        schema_date = self._meta_tag(meta, 'property', 'datePublished')
         if schema_date and schema_date.get('content'):
             try:
                 return datetime.fromisoformat(schema_date['content'].replace('Z', '+00:00'))
@@ -809,54 +1053,61 @@ class ArticleContentParser:
         
         return None
     
-    def _extract_author(self, soup: BeautifulSoup) -> str:
+    def _extract_author(self, soup: BeautifulSoup, class_index: Optional[Dict[str, List[Any]]] = None, meta: Optional[Dict[Tuple[str, str], List[Any]]] = None) -> str:
         """Extract article author"""
+        if meta is None:
+            meta = self._collect_meta_tags(soup)
+        
         # Strategy 1: Open Graph author
-        og_author = soup.find('meta', attrs={'property': 'article:author'})
+        og_author = self._meta_tag(meta, 'property', 'article:author')
         if og_author and og_author.get('content'):
             return self.scraper.clean_text(og_author['content'])
         
         # Strategy 2: Author classes
-        author_selectors = [
-            '.author',
-            '.byline',
-            '.writer',
-            '[class*="author"]'
-        ]
-        
-        for selector in author_selectors:
-            author_elem = soup.select_one(selector)
-            if author_elem:
-                author = self.scraper.clean_text(author_elem.get_text())
-                if author:
-                    return author
+        if class_index is None:
+            class_index = self._build_class_index(soup)
+        for author_elem in class_index['author']:
+            author = self.scraper.clean_text(author_elem.get_text())
+            if author:
+                return author
         
         return ""
     
-    def _extract_category(self, soup: BeautifulSoup) -> str:
+    def _extract_category(self, soup: BeautifulSoup, class_index: Optional[Dict[str, List[Any]]] = None, meta: Optional[Dict[Tuple[str, str], List[Any]]] = None) -> str:
         """Extract article category"""
+        if meta is None:
+            meta = self._collect_meta_tags(soup)
+        
         # Strategy 1: Open Graph section
-        og_section = soup.find('meta', attrs={'property': 'article:section'})
+        og_section = self._meta_tag(meta, 'property', 'article:section')
         if og_section and og_section.get('content'):
             return self.scraper.clean_text(og_section['content'])
         
         # Strategy 2: Category classes
-        category_selectors = [
-            '.category',
-            '.section',
-            '.tag',
-            '[class*="category"]'
-        ]
-        
-        for selector in category_selectors:
-            category_elem = soup.select_one(selector)
-            if category_elem:
-                category = self.scraper.clean_text(category_elem.get_text())
-                if category:
-                    return category
+        if class_index is None:
+            class_index = self._build_class_index(soup)
+        for category_elem in class_index['category']:
+            category = self.scraper.clean_text(category_elem.get_text())
+            if category:
+                return category
         
         return ""
     
+    def _build_class_index(self, soup: BeautifulSoup) -> Dict[str, List[Any]]:
+        """First element for each author/category class rule, in priority order, from one traversal"""
+        firsts = {field: [None] * (len(exact_classes) + 1) for field, (exact_classes, _) in self._CLASS_RULES.items()}
+        for elem in soup.find_all(class_=True):
+            classes = elem.get('class', [])
+            class_string = ' '.join(classes)
+            for field, (exact_classes, substring) in self._CLASS_RULES.items():
+                ranks = firsts[field]
+                for rank, class_name in enumerate(exact_classes):
+                    if ranks[rank] is None and class_name in classes:
+                        ranks[rank] = elem
+                if ranks[-1] is None and substring in class_string:
+                    ranks[-1] = elem
+        return {field: [elem for elem in ranks if elem is not None] for field, ranks in firsts.items()}
+    
     def _validate_content_quality(self, content: str, title: str = "") -> Dict[str, Any]:
         """Validate content quality and return quality metrics"""
         if not content:
@@ -893,35 +1144,23 @@ class ArticleContentParser:
             issues.append(f'Few paragraphs: {paragraph_count}')
             quality_score -= 0.1
         
-        # Check for boilerplate text
-        boilerplate_indicators = [
-            'cookie policy',
-            'privacy policy',
-            'terms of service',
-            'all rights reserved',
-            'copyright',
-            'follow us on',
-            'subscribe to',
-            'newsletter',
-            'advertisement',
-            'sponsored content'
-        ]
-        
-        content_lower = content.lower()
-        boilerplate_found = [indicator for indicator in boilerplate_indicators if indicator in content_lower]
+        # Check for boilerplate text (one case-insensitive scan, reported in indicator order)
+        matched = {match.lower() for match in self._BOILERPLATE_RE.findall(content)}
+        boilerplate_found = [indicator for indicator in self._BOILERPLATE_INDICATORS if indicator in matched]
         if boilerplate_found:
             issues.append(f'Contains boilerplate: {", ".join(boilerplate_found)}')
             quality_score -= 0.2
         
         # Check for repetitive content
-        if len(set(words)) < len(words) * 0.3:  # Less than 30% unique words
+        if len(set(words)) < word_count * 0.3:  # Less than 30% unique words
             issues.append('High repetition in content')
             quality_score -= 0.2
         
-        # Check if content seems to match title
+        # Check if content seems to match title (reuses the word split above; case-folded
+        # per token, so the article body is never copied just to compare case)
         if title:
-            title_words = set(title.lower().split())
-            content_words = set(content.lower().split())
+            title_words = {word.casefold() for word in title.split()}
+            content_words = {word.casefold() for word in words}
             common_words = title_words.intersection(content_words)
             if len(common_words) < 2:
                 issues.append('Content may not match title')
@@ -935,6 +1174,20 @@ class ArticleContentParser:
             'paragraph_count': paragraph_count
         }
 
+# Per-process parser used by parse_article_page (created on first use in each worker)
+_worker_content_parser = None
+
+def parse_article_page(content: bytes, article_url: str) -> Optional[Dict[str, Any]]:
+    """Parse a fetched article page and extract its content; module-level so a process pool can run it"""
+    global _worker_content_parser
+    if _worker_content_parser is None:
+        _worker_content_parser = ArticleContentParser(WebScraper())
+    
+    soup = _worker_content_parser.scraper.parse_page(content, 'article')
+    if not soup:
+        return None
+    return _worker_content_parser.extract_article_content(soup, article_url)
+
 class ScraperToDatabase:
     """Main class for processing web scraping and storing in database"""
     
@@ -946,12 +1199,30 @@ class ScraperToDatabase:
         self.scraper = WebScraper()
         self.listing_parser = ArticleListingParser(self.scraper)
         self.content_parser = ArticleContentParser(self.scraper)
+        self._parse_pool = None  # Created on first use, shut down at the end of a run
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Return the process pool that parses article pages (CPU-bound) off the main process"""
+        if self._parse_pool is None:
+            # Never fork this process: it runs fetch threads (and, under the workflow,
+            # other steps and the API server), and forking a threaded process can deadlock
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            # Leave one core for the main process (fetch threads, database writes)
+            self._parse_pool = ProcessPoolExecutor(max_workers=max(2, (os.cpu_count() or 1) - 1),
+                                                   mp_context=multiprocessing.get_context(start_method))
+        return self._parse_pool
+    
+    def _shutdown_parse_pool(self):
+        """Stop the article parsing worker processes"""
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
     
     def read_sources_from_file(self, file_path: str) -> List[str]:
         """Read scraper source URLs from file"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+                urls = [url for line in f if (url := line.strip()) and not url.startswith('#')]
             logger.info(f"Loaded {len(urls)} scraper source URLs from {file_path}")
             return urls
         except Exception as e:
@@ -989,6 +1260,15 @@ class ScraperToDatabase:
             
             logger.info(f"Processing {len(source_urls)} scraper sources...")
             
+            # Compact snapshot of stored links/guids (8-byte digests, not full URL strings);
+            # None falls back to per-source queries
+            known_urls = self.db.get_all_links()
+            known_url_digests = {url_digest(url) for url in known_urls} if known_urls is not None else None
+            del known_urls  # Only the digests are kept for the run
+            
+            # Listing pages are on different hosts: fetch them all concurrently up front
+            listing_contents = self.scraper.fetch_many_contents(source_urls)
+            
             for i, source_url in enumerate(source_urls, 1):
                 source_start_time = datetime.now()
                 logger.info(f"Processing source {i}/{len(source_urls)}: {source_url}")
@@ -1003,8 +1283,11 @@ class ScraperToDatabase:
                 }
                 
                 try:
-                    # Fetch listing page
-                    soup = self.scraper.fetch_page(source_url)
+                    domain = urlparse(source_url).netloc
+                    
+                    # Parse prefetched listing page
+                    listing_content = listing_contents.get(source_url)
+                    soup = self.scraper.parse_page(listing_content, 'listing') if listing_content is not None else None
                     if not soup:
                         logger.error(f"Failed to fetch source: {source_url}")
                         total_stats['sources_failed'] += 1
@@ -1022,23 +1305,43 @@ class ScraperToDatabase:
                     articles_added = 0
                     duplicates_skipped = 0
                     short_content_skipped = 0
+                    pending_articles = []
                     
+                    # Skip URLs that are already stored. A digest hit may be a collision,
+                    # so only those candidates are confirmed against the database.
+                    if known_url_digests is not None:
+                        suspected_urls = [url for url in article_urls if url_digest(url) in known_url_digests]
+                        existing_urls = self.scraper.check_urls_exist(suspected_urls, self.db)
+                    else:
+                        existing_urls = self.scraper.check_urls_exist(article_urls, self.db)
+                    new_article_urls = []
                     for article_url in article_urls:
+                        if article_url in existing_urls:
+                            logger.debug(f"Article already exists, skipping: {article_url}")
+                            duplicates_skipped += 1
+                        else:
+                            new_article_urls.append(article_url)
+                    
+                    # Fetch remaining article pages concurrently, then parse them in worker processes
+                    article_contents = self.scraper.fetch_many_contents(new_article_urls)
+                    parse_pool = self._get_parse_pool()
+                    parsed_articles = {
+                        article_url: parse_pool.submit(parse_article_page, content, article_url)
+                        for article_url, content in article_contents.items() if content is not None
+                    }
+                    
+                    for article_url in new_article_urls:
                         try:
-                            # Check if URL already exists
-                            if self.scraper.check_url_exists(article_url, self.db):
-                                logger.debug(f"Article already exists, skipping: {article_url}")
-                                duplicates_skipped += 1
-                                continue
-                            
-                            # Fetch article page
-                            article_soup = self.scraper.fetch_page(article_url)
-                            if not article_soup:
+                            parsed_article = parsed_articles.get(article_url)
+                            if not parsed_article:
                                 logger.warning(f"Failed to fetch article: {article_url}")
                                 continue
                             
                             # Extract article content
-                            article_data = self.content_parser.extract_article_content(article_soup, article_url)
+                            article_data = parsed_article.result()
+                            if not article_data:
+                                logger.warning(f"Failed to parse article: {article_url}")
+                                continue
                             
                             # Check content length threshold
                             content_length = len(article_data['content'])
@@ -1056,9 +1359,10 @@ class ScraperToDatabase:
                             # Create RSSArticle object
                             article = RSSArticle()
                             article.title = article_data['title']
-                            article.content = article_data['content']
-                            article.description = article_data['content'][:500] + "..." if len(article_data['content']) > 500 else article_data['content']
-                            article.summary = article_data['content'][:200] + "..." if len(article_data['content']) > 200 else article_data['content']
+                            content = article_data['content']
+                            article.content = content
+                            article.description = content[:500] + "..." if content_length > 500 else content
+                            article.summary = content[:200] + "..." if content_length > 200 else content
                             article.link = article_url
                             article.guid = article_url  # Use URL as GUID for duplicate detection
                             article.published = article_data['published'] or datetime.now(timezone.utc)
@@ -1068,24 +1372,27 @@ class ScraperToDatabase:
                             article.image_urls = [article_data['image_url']] if article_data['image_url'] else []
                             
                             # Set source information
-                            domain = urlparse(source_url).netloc
                             article.source_name = f"SCRAPED: {domain}"
                             article.source_url = source_url
                             article.feed_url = article_url
                             
-                            # Insert into database
-                            if self.db.insert_article(article):
-                                articles_added += 1
-                                logger.info(f"Added article: {article.title[:50]}... ({content_length} chars)")
-                            else:
-                                duplicates_skipped += 1
-                                logger.debug(f"Article already exists (content hash): {article.title[:50]}...")
+                            # Queue for the per-source batch insert
+                            pending_articles.append(article)
+                            logger.debug(f"Queued article: {article.title[:50]}... ({content_length} chars)")
                             
                         except Exception as e:
                             logger.error(f"Error processing article {article_url}: {e}")
                             total_stats['errors'] += 1
                             continue
                     
+                    # Insert this source's articles in one transaction
+                    batch_stats = self.db.insert_articles_batch(pending_articles)
+                    articles_added += batch_stats['new_articles']
+                    duplicates_skipped += batch_stats['duplicates']
+                    total_stats['errors'] += batch_stats['errors']
+                    if known_url_digests is not None:
+                        known_url_digests.update(url_digest(article.link) for article in pending_articles)
+                    
                     # Update statistics
                     total_stats['new_articles_added'] += articles_added
                     total_stats['duplicates_skipped'] += duplicates_skipped
@@ -1098,7 +1405,6 @@ class ScraperToDatabase:
                     self.scraper.scraping_results['successful_sources'].append(source_info)
                     
                     # Track articles by source
-                    domain = urlparse(source_url).netloc
                     self.scraper.scraping_results['articles_by_source'][domain] = \
                         self.scraper.scraping_results['articles_by_source'].get(domain, 0) + articles_added
                     
@@ -1112,9 +1418,6 @@ class ScraperToDatabase:
                     source_info['errors'].append(str(e))
                     self.scraper.scraping_results['failed_sources'].append(source_info)
                     continue
-                
-                # Small delay between requests
-                time.sleep(1)
             
             # Calculate total processing time
             total_stats['processing_time'] = (datetime.now() - start_time).total_seconds()
@@ -1128,6 +1431,8 @@ class ScraperToDatabase:
             logger.error(f"Error in web scraping to database processing: {e}")
             total_stats['processing_time'] = (datetime.now() - start_time).total_seconds()
             return total_stats
+        finally:
+            self._shutdown_parse_pool()
     
     def print_processing_summary(self, stats: Dict[str, Any]):
         """Print processing summary"""
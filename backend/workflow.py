@@ -1,17 +1,24 @@
 #!/usr/bin/env python3
 """
 Workflow Orchestrator
-Executes the complete article processing pipeline in sequence
+Executes the complete article processing pipeline: data sources concurrently, then processing steps in sequence
 """
 
 import sys
 import os
+import json
+import atexit
+import threading
+import time
+from collections import namedtuple
 from datetime import datetime
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Tuple
 
 # Resolve script directory for log file
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 LOG_FILE = os.path.join(SCRIPT_DIR, 'workflow_log.txt')
+JSONL_LOG_FILE = os.path.join(SCRIPT_DIR, 'workflow_log.jsonl')  # One JSON record per step
 
 # Import all modules
 import rss2db
@@ -35,21 +42,238 @@ ENABLE_AI_REWRITER = ENABLE_AI_EDITOR      # Enable AI article rewriter (ai_rewr
 
 # =============================================================================
 
+# A workflow step: its name, console description, run function and keyword args
+Step = namedtuple('Step', 'name description function args')
+
+# Log files stay open for the whole run (closed at exit) and are line-buffered, so
+# each entry reaches disk immediately; the lock serializes writes from concurrent steps
+_log_handles = {}
+_log_lock = threading.Lock()
+
+# Log timestamp format; the formatted string is reused within the same second
+_TS_FMT = '%Y-%m-%d %H:%M:%S'
+_last_ts_sec = None
+_last_ts = ''
+
+def _close_log_files():
+    """Flush and close all open log files"""
+    with _log_lock:
+        for handle in _log_handles.values():
+            handle.close()
+        _log_handles.clear()
+
+atexit.register(_close_log_files)
+
+def flush_log_files():
+    """Push buffered log lines to disk"""
+    with _log_lock:
+        for handle in _log_handles.values():
+            handle.flush()
+
+def _timestamp() -> str:
+    """Return the current log timestamp, reformatting at most once per second"""
+    global _last_ts_sec, _last_ts
+    now_sec = int(time.time())
+    if now_sec != _last_ts_sec:
+        _last_ts = time.strftime(_TS_FMT, time.localtime(now_sec))
+        _last_ts_sec = now_sec
+    return _last_ts
+
+def _write_log(log_file: str, log_entry: str):
+    """Append an entry to a log file, opening it on first use (caller holds _log_lock)"""
+    handle = _log_handles.get(log_file)
+    if handle is None:
+        handle = _log_handles[log_file] = open(log_file, 'a', encoding='utf-8', buffering=1)
+    handle.write(log_entry)
+
 def log_to_file(message: str, log_file: str = LOG_FILE):
     """Log message to file with timestamp"""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_entry = f"[{timestamp}] {message}\n"
-    
     try:
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+        with _log_lock:
+            _write_log(log_file, f"[{_timestamp()}] {message}\n")
     except Exception as e:
         print(f"Error writing to log file: {e}")
 
+def log_json(record: Dict[str, Any], log_file: str = JSONL_LOG_FILE):
+    """Append a structured record as one JSON line"""
+    try:
+        with _log_lock:
+            record = {'ts': _timestamp(), **record}
+            _write_log(log_file, json.dumps(record, ensure_ascii=False, default=str) + "\n")
+    except Exception as e:
+        print(f"Error writing to JSON log file: {e}")
+
+class _ThreadRoutedStdout:
+    """sys.stdout stand-in: threads with a capture buffer write to it, others pass through"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            return self._stream.write(text)
+        buffer.append(text)
+        return len(text)
+    
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self._stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+    
+    def run_captured(self, func, *args) -> Tuple[Any, str]:
+        """Call func in the current thread, returning its result and everything it printed"""
+        self._local.buffer = []
+        try:
+            return func(*args), ''.join(self._local.buffer)
+        finally:
+            self._local.buffer = None
+
+def run_step(i: int, step: Step, total_steps: int, log_file: str = LOG_FILE,
+             json_log_file: str = JSONL_LOG_FILE) -> Dict[str, Any]:
+    """Execute a single workflow step and return its result record"""
+    step_name = step.name
+    step_desc = step.description
+    step_func = step.function
+    step_args = step.args
+    
+    print(f"Step {i}/{total_steps}: {step_desc}\n" + "-" * 60)
+    
+    # Wall-clock stamps are only for the record; durations use the monotonic perf_counter
+    step_start_time = datetime.now().isoformat()
+    step_start_perf = time.perf_counter()
+    log_to_file(f"Starting step {i}: {step_desc}", log_file)
+    
+    # Check database state before ai_writer step
+    db_state = None
+    if step_name == 'ai_writer':
+        try:
+            # Counts only: skips AIWriter construction (AI client, prompt, table setup)
+            db_state = stats = ai_writer.peek_writing_statistics()
+            log_to_file(f"Database state before AI Writer: total={stats['total_rss_articles']} "
+                        f"unread={stats['unread_rss_articles']} read={stats['read_rss_articles']} "
+                        f"ours={stats['our_articles_count']}", log_file)
+            
+            out = [
+                "Database state before AI Writer:",
+                f"  - Total RSS articles: {stats['total_rss_articles']}",
+                f"  - Unread articles: {stats['unread_rss_articles']}",
+                f"  - Read articles: {stats['read_rss_articles']}"
+            ]
+            
+            if stats['unread_rss_articles'] == 0:
+                warning_msg = "WARNING: No unread articles available! AI Writer may generate 0 articles."
+                log_to_file(warning_msg, log_file)
+                out.append(f"  ⚠️  {warning_msg}")
+            elif stats['unread_rss_articles'] < 5:
+                info_msg = f"Info: Only {stats['unread_rss_articles']} unread articles available (target is usually 5)."
+                log_to_file(info_msg, log_file)
+                out.append(f"  ℹ️  {info_msg}")
+            print('\n'.join(out) + '\n')
+        except Exception as e:
+            log_to_file(f"Error checking database state before ai_writer: {e}", log_file)
+            print(f"  ⚠️  Could not check database state: {e}")
+    
+    try:
+        # Execute the step
+        result = step_func(**step_args)
+        
+        step_duration = time.perf_counter() - step_start_perf
+        step_end_time = datetime.now().isoformat()
+        
+        # Log success
+        log_to_file(f"Step {i} COMPLETED SUCCESSFULLY in {step_duration:.2f} seconds", log_file)
+        
+        # Special handling for AI writer statistics (full figures go to the JSON log)
+        is_writer_stats = step_name == 'ai_writer' and isinstance(result, dict) and 'ai_trials' in result
+        if is_writer_stats:
+            log_to_file(f"AI Writer Statistics: generated={result['articles_generated']}/{result['articles_target']} "
+                        f"trials={result['ai_trials']} skipped={result['articles_skipped']} "
+                        f"success_rate={result['success_rate']}% groups={result['processed_groups']}", log_file)
+            
+            # Highlight if zero articles generated
+            if result['articles_generated'] == 0:
+                log_to_file("⚠️  WARNING: AI Writer generated ZERO articles! (no unread articles, "
+                            "failed validation/generation, or processing errors)", log_file)
+        
+        # Store results
+        step_result = {
+            'status': 'SUCCESS',
+            'start_time': step_start_time,
+            'end_time': step_end_time,
+            'duration': step_duration,
+            'result': result,
+            'error': None
+        }
+        
+        out = [f"+ {step_desc} completed successfully in {step_duration:.2f} seconds"]
+        
+        # Print AI writer statistics to console as well
+        if is_writer_stats:
+            out += [
+                "  AI Writer Results:",
+                f"    Articles generated: {result['articles_generated']}/{result['articles_target']}",
+                f"    AI trials made: {result['ai_trials']}",
+                f"    Articles skipped: {result['articles_skipped']}",
+                f"    Success rate: {result['success_rate']}%",
+                f"    Processed groups: {result['processed_groups']}"
+            ]
+            
+            # Highlight if zero articles generated
+            if result['articles_generated'] == 0:
+                out.append("    ⚠️  WARNING: Zero articles generated!")
+                if result['ai_trials'] > 0:
+                    out.append(f"    ⚠️  {result['ai_trials']} AI trials were made but all failed or were skipped")
+                if result['articles_skipped'] > 0:
+                    out.append(f"    ⚠️  {result['articles_skipped']} articles were skipped during processing")
+                out.append("    💡 Check the logs above for detailed skip reasons")
+        print('\n'.join(out))
+        
+    except Exception as e:
+        step_duration = time.perf_counter() - step_start_perf
+        step_end_time = datetime.now().isoformat()
+        
+        # Log error
+        error_msg = f"Step {i} FAILED: {str(e)}"
+        log_to_file(error_msg, log_file)
+        
+        # Store error results
+        step_result = {
+            'status': 'FAILED',
+            'start_time': step_start_time,
+            'end_time': step_end_time,
+            'duration': step_duration,
+            'result': None,
+            'error': str(e)
+        }
+        
+        print(f"- {step_desc} failed: {str(e)}\n"
+              f"  Duration: {step_duration:.2f} seconds\n"
+              f"  Continuing with next step...")
+    
+    print()
+    
+    # One structured record per step
+    log_json({
+        'step': step_name,
+        'status': step_result['status'],
+        'duration': step_result['duration'],
+        'error': step_result['error'],
+        'db_state': db_state,
+        'result': step_result['result']
+    }, json_log_file)
+    
+    return step_result
+
 def run_workflow() -> Dict[str, Any]:
     """Execute complete workflow pipeline"""
     start_time = datetime.now()
+    start_perf = time.perf_counter()
     log_file = LOG_FILE
+    json_log_file = JSONL_LOG_FILE
     
     # Initialize log file
     log_to_file("=" * 80, log_file)
@@ -61,57 +285,29 @@ def run_workflow() -> Dict[str, Any]:
     log_to_file("=" * 80, log_file)
     
     # Define workflow steps - conditionally include sources
-    workflow_steps = []
+    source_steps = []
 
     # Add data collection sources based on configuration
     if ENABLE_RSS_SOURCE:
-        workflow_steps.append({
-            'name': 'rss2db',
-            'description': 'RSS to Database Processing',
-            'function': rss2db.run,
-            'args': {}
-        })
+        source_steps.append(Step('rss2db', 'RSS to Database Processing', rss2db.run, {}))
 
     if ENABLE_SCRAPER_SOURCE:
-        workflow_steps.append({
-            'name': 'scraper2db',
-            'description': 'Web Scraper to Database Processing',
-            'function': scraper2db.run,
-            'args': {}
-        })
+        source_steps.append(Step('scraper2db', 'Web Scraper to Database Processing', scraper2db.run, {}))
 
     # Add processing steps (always enabled)
-    workflow_steps.extend([
-        {
-            'name': 'group_articles',
-            'description': 'Article Grouping',
-            'function': group_articles.run,
-            'args': {}
-        },
-        {
-            'name': 'ai_writer',
-            'description': 'AI Article Writing',
-            'function': ai_writer.run,
-            'args': {}
-        }
-    ])
+    processing_steps = [
+        Step('group_articles', 'Article Grouping', group_articles.run, {}),
+        Step('ai_writer', 'AI Article Writing', ai_writer.run, {})
+    ]
     
     # Add AI processing steps based on configuration
     if ENABLE_AI_EDITOR:
-        workflow_steps.append({
-            'name': 'ai_editor',
-            'description': 'AI Article Editing',
-            'function': ai_editor.run,
-            'args': {}
-        })
+        processing_steps.append(Step('ai_editor', 'AI Article Editing', ai_editor.run, {}))
     
     if ENABLE_AI_REWRITER:
-        workflow_steps.append({
-            'name': 'ai_rewriter',
-            'description': 'AI Article Rewriting',
-            'function': ai_rewriter.run,
-            'args': {}
-        })
+        processing_steps.append(Step('ai_rewriter', 'AI Article Rewriting', ai_rewriter.run, {}))
+    
+    workflow_steps = source_steps + processing_steps
     
     results = {
         'start_time': start_time.isoformat(),
@@ -121,144 +317,55 @@ def run_workflow() -> Dict[str, Any]:
         'total_steps': len(workflow_steps)  # Dynamic count
     }
     
-    print("=" * 80)
-    print("WORKFLOW EXECUTION STARTED")
-    print("=" * 80)
-    print(f"Start time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Log file: {log_file}")
-    print()
+    # Each console block is written with a single print call
+    print('\n'.join([
+        "=" * 80,
+        "WORKFLOW EXECUTION STARTED",
+        "=" * 80,
+        f"Start time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Log file: {log_file}",
+        ""
+    ]))
     
-    # Execute each step
-    for i, step in enumerate(workflow_steps, 1):
-        step_name = step['name']
-        step_desc = step['description']
-        step_func = step['function']
-        step_args = step['args']
-        
-        print(f"Step {i}/{len(workflow_steps)}: {step_desc}")
-        print("-" * 60)
-        
-        step_start_time = datetime.now()
-        log_to_file(f"Starting step {i}: {step_desc}", log_file)
-        
-        # Check database state before ai_writer step
-        if step_name == 'ai_writer':
-            try:
-                writer = ai_writer.AIWriter()
-                stats = writer.get_writing_statistics()
-                log_to_file(f"Database state before AI Writer:", log_file)
-                log_to_file(f"  - Total RSS articles: {stats['total_rss_articles']}", log_file)
-                log_to_file(f"  - Unread articles: {stats['unread_rss_articles']}", log_file)
-                log_to_file(f"  - Read articles: {stats['read_rss_articles']}", log_file)
-                log_to_file(f"  - Our articles (existing): {stats['our_articles_count']}", log_file)
-                
-                print(f"Database state before AI Writer:")
-                print(f"  - Total RSS articles: {stats['total_rss_articles']}")
-                print(f"  - Unread articles: {stats['unread_rss_articles']}")
-                print(f"  - Read articles: {stats['read_rss_articles']}")
-                
-                if stats['unread_rss_articles'] == 0:
-                    warning_msg = "WARNING: No unread articles available! AI Writer may generate 0 articles."
-                    log_to_file(warning_msg, log_file)
-                    print(f"  ⚠️  {warning_msg}")
-                elif stats['unread_rss_articles'] < 5:
-                    info_msg = f"Info: Only {stats['unread_rss_articles']} unread articles available (target is usually 5)."
-                    log_to_file(info_msg, log_file)
-                    print(f"  ℹ️  {info_msg}")
-                print()
-            except Exception as e:
-                log_to_file(f"Error checking database state before ai_writer: {e}", log_file)
-                print(f"  ⚠️  Could not check database state: {e}")
-        
-        try:
-            # Execute the step
-            result = step_func(**step_args)
-            
-            step_end_time = datetime.now()
-            step_duration = (step_end_time - step_start_time).total_seconds()
-            
-            # Log success
-            log_to_file(f"Step {i} COMPLETED SUCCESSFULLY in {step_duration:.2f} seconds", log_file)
-            
-            # Special handling for AI writer statistics
-            if step_name == 'ai_writer' and isinstance(result, dict) and 'ai_trials' in result:
-                log_to_file(f"AI Writer Statistics:", log_file)
-                log_to_file(f"  - Articles generated: {result['articles_generated']}/{result['articles_target']}", log_file)
-                log_to_file(f"  - AI trials made: {result['ai_trials']}", log_file)
-                log_to_file(f"  - Articles skipped: {result['articles_skipped']}", log_file)
-                log_to_file(f"  - Success rate: {result['success_rate']}%", log_file)
-                log_to_file(f"  - Processed groups: {result['processed_groups']}", log_file)
-                
-                # Highlight if zero articles generated
-                if result['articles_generated'] == 0:
-                    warning_msg = "⚠️  WARNING: AI Writer generated ZERO articles!"
-                    log_to_file(warning_msg, log_file)
-                    log_to_file(f"  This may indicate:", log_file)
-                    log_to_file(f"    - No unread articles were available", log_file)
-                    log_to_file(f"    - All articles failed validation or AI generation", log_file)
-                    log_to_file(f"    - Articles were skipped due to processing errors", log_file)
-            
-            # Store results
-            results['steps'][step_name] = {
-                'status': 'SUCCESS',
-                'start_time': step_start_time.isoformat(),
-                'end_time': step_end_time.isoformat(),
-                'duration': step_duration,
-                'result': result,
-                'error': None
-            }
-            
+    def record(step_name: str, step_result: Dict[str, Any], console: str = ''):
+        if console:
+            sys.stdout.write(console)
+            sys.stdout.flush()
+        results['steps'][step_name] = step_result
+        if step_result['status'] == 'SUCCESS':
             results['success_count'] += 1
-            
-            print(f"+ {step_desc} completed successfully in {step_duration:.2f} seconds")
-            
-            # Print AI writer statistics to console as well
-            if step_name == 'ai_writer' and isinstance(result, dict) and 'ai_trials' in result:
-                print(f"  AI Writer Results:")
-                print(f"    Articles generated: {result['articles_generated']}/{result['articles_target']}")
-                print(f"    AI trials made: {result['ai_trials']}")
-                print(f"    Articles skipped: {result['articles_skipped']}")
-                print(f"    Success rate: {result['success_rate']}%")
-                print(f"    Processed groups: {result['processed_groups']}")
-                
-                # Highlight if zero articles generated
-                if result['articles_generated'] == 0:
-                    print(f"    ⚠️  WARNING: Zero articles generated!")
-                    if result['ai_trials'] > 0:
-                        print(f"    ⚠️  {result['ai_trials']} AI trials were made but all failed or were skipped")
-                    if result['articles_skipped'] > 0:
-                        print(f"    ⚠️  {result['articles_skipped']} articles were skipped during processing")
-                    print(f"    💡 Check the logs above for detailed skip reasons")
-            
-        except Exception as e:
-            step_end_time = datetime.now()
-            step_duration = (step_end_time - step_start_time).total_seconds()
-            
-            # Log error
-            error_msg = f"Step {i} FAILED: {str(e)}"
-            log_to_file(error_msg, log_file)
-            
-            # Store error results
-            results['steps'][step_name] = {
-                'status': 'FAILED',
-                'start_time': step_start_time.isoformat(),
-                'end_time': step_end_time.isoformat(),
-                'duration': step_duration,
-                'result': None,
-                'error': str(e)
-            }
-            
+        else:
             results['failure_count'] += 1
-            
-            print(f"- {step_desc} failed: {str(e)}")
-            print(f"  Duration: {step_duration:.2f} seconds")
-            print(f"  Continuing with next step...")
-        
-        print()
+    
+    total_steps = len(workflow_steps)
+    
+    # Stage 1: data sources are independent and network-bound, so run them concurrently
+    if len(source_steps) > 1:
+        # Everything a source prints (run_step and the module's own output) is captured
+        # per thread and replayed in step order as each source finishes
+        real_stdout = sys.stdout
+        routed_stdout = sys.stdout = _ThreadRoutedStdout(real_stdout)
+        try:
+            with ThreadPoolExecutor(max_workers=len(source_steps)) as executor:
+                futures = [executor.submit(routed_stdout.run_captured, run_step,
+                                           i, step, total_steps, log_file, json_log_file)
+                           for i, step in enumerate(source_steps, 1)]
+                for step, future in zip(source_steps, futures):
+                    step_result, console = future.result()
+                    record(step.name, step_result, console)
+        finally:
+            sys.stdout = real_stdout
+    else:
+        for i, step in enumerate(source_steps, 1):
+            record(step.name, run_step(i, step, total_steps, log_file, json_log_file))
+    
+    # Stage 2: processing steps read the collected articles and run in sequence
+    for i, step in enumerate(processing_steps, len(source_steps) + 1):
+        record(step.name, run_step(i, step, total_steps, log_file, json_log_file))
     
     # Calculate total duration
     end_time = datetime.now()
-    total_duration = (end_time - start_time).total_seconds()
+    total_duration = time.perf_counter() - start_perf
     results['end_time'] = end_time.isoformat()
     results['total_duration'] = total_duration
     
@@ -269,30 +376,35 @@ def run_workflow() -> Dict[str, Any]:
     log_to_file(f"Successful steps: {results['success_count']}/{results['total_steps']}", log_file)
     log_to_file(f"Failed steps: {results['failure_count']}/{results['total_steps']}", log_file)
     log_to_file("=" * 80, log_file)
+    flush_log_files()
     
     # Print final summary
-    print("=" * 80)
-    print("WORKFLOW EXECUTION COMPLETED")
-    print("=" * 80)
-    print(f"End time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Total duration: {total_duration:.2f} seconds")
-    print(f"Successful steps: {results['success_count']}/{results['total_steps']}")
-    print(f"Failed steps: {results['failure_count']}/{results['total_steps']}")
-    print()
+    summary = [
+        "=" * 80,
+        "WORKFLOW EXECUTION COMPLETED",
+        "=" * 80,
+        f"End time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Total duration: {total_duration:.2f} seconds",
+        f"Successful steps: {results['success_count']}/{results['total_steps']}",
+        f"Failed steps: {results['failure_count']}/{results['total_steps']}",
+        ""
+    ]
     
-    # Print step summary
-    print("STEP SUMMARY:")
-    print("-" * 40)
+    # Step summary
+    summary.append("STEP SUMMARY:")
+    summary.append("-" * 40)
     for step_name, step_result in results['steps'].items():
         status_icon = "+" if step_result['status'] == 'SUCCESS' else "-"
         duration = step_result['duration']
-        print(f"{status_icon} {step_name}: {step_result['status']} ({duration:.2f}s)")
+        summary.append(f"{status_icon} {step_name}: {step_result['status']} ({duration:.2f}s)")
         if step_result['error']:
-            print(f"    Error: {step_result['error']}")
+            summary.append(f"    Error: {step_result['error']}")
     
-    print()
-    print(f"Detailed log saved to: {log_file}")
-    print("=" * 80)
+    summary.append("")
+    summary.append(f"Detailed log saved to: {log_file}")
+    summary.append(f"Step records saved to: {json_log_file}")
+    summary.append("=" * 80)
+    print('\n'.join(summary))
     
     return results
 